@@ -56,6 +56,17 @@ COLOR_ACCENT = "#0078d4"     # Windows blue
 COLOR_SUCCESS = "#27ae60"
 COLOR_WARNING = "#f39c12"
 COLOR_ERROR = "#e74c3c"
+COLOR_INFO = "#3498db"       # Blue
+COLOR_NEUTRAL = "#95a5a6"    # Gray
+
+# Alpha (0-255) of the translucent row tints in the subject mapping dialog
+MAPPING_TINT_ALPHA = 30
+
+# Idle time after the last edit before a changed subject mapping is saved
+MAPPING_SAVE_DELAY = 300  # milliseconds
+
+# Window in which bursts of data-change signals collapse into one refresh
+REFRESH_DELAY = 50  # milliseconds
 
 # ============================================================================
 # VOTE TYPE CONSTANTS
@@ -40,6 +40,8 @@ class Database:
         # Caches for frequently accessed data
         self._subject_cache = None
         self._year_cache = None
+        # Bumped on every subject mutation so UI caches can tell when to reload
+        self._subjects_version = 0
         # Persistent database connection
         self._connection = None
         self._init_db()
@@ -133,6 +135,7 @@ class Database:
             cursor.execute("UPDATE school_years SET is_active = 0")
             cursor.execute("UPDATE school_years SET is_active = 1 WHERE id = ?", (year_id,))
             conn.commit()
+            self._year_cache = None  # Invalidate cache
     
     def add_school_year(self, start_year: int) -> bool:
         """
@@ -429,6 +432,24 @@ class Database:
         """
         self.set_setting(f"{provider_id}_mapping_{source_subject}", target_subject)
 
+    def save_provider_subject_mappings(self, provider_id: str, mappings: dict[str, str]):
+        """
+        Save several subject mappings for a provider in one transaction.
+
+        Args:
+            provider_id: Provider identifier
+            mappings: Dict of source_subject -> target_subject
+        """
+        if not mappings:
+            return
+        prefix = f"{provider_id}_mapping_"
+        with self._get_connection() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+                [(prefix + source, target) for source, target in mappings.items()]
+            )
+            conn.commit()
+
     def get_provider_subject_mapping(self, provider_id: str, source_subject: str) -> str | None:
         """
         Get the VoteTracker subject for a provider's subject.
@@ -538,6 +559,10 @@ class Database:
                 self._subject_cache = [row["name"] for row in cursor.fetchall()]
         return self._subject_cache.copy()  # Return copy to prevent external mutation
     
+    def get_subjects_version(self) -> int:
+        """Counter that changes whenever subjects are added, renamed or deleted."""
+        return self._subjects_version
+
     def get_subject_id(self, name: str) -> int | None:
         """Get subject ID by name."""
         with self._get_connection() as conn:
@@ -560,6 +585,7 @@ class Database:
                 conn.commit()
                 result = cursor.lastrowid
                 self._subject_cache = None  # Invalidate cache
+                self._subjects_version += 1
                 return result
         except sqlite3.IntegrityError:
             logger.warning(f"Subject '{name}' already exists")
@@ -589,6 +615,7 @@ class Database:
                 result = cursor.rowcount > 0
                 if result:
                     self._subject_cache = None  # Invalidate cache
+                    self._subjects_version += 1
                 return result
         except sqlite3.IntegrityError as e:
             logger.error(f"Failed to rename subject (integrity error): {e}")
@@ -618,6 +645,7 @@ class Database:
                     cursor.execute("DELETE FROM subjects WHERE id = ?", (subject_id,))
                     conn.commit()
                     self._subject_cache = None  # Invalidate cache
+                    self._subjects_version += 1
                     return True
                 return False
         except sqlite3.Error as e:
@@ -4,22 +4,174 @@ Contains all popup dialogs for adding/editing data.
 """
 from __future__ import annotations
 
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from html import escape
+
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
     QLabel, QPushButton, QLineEdit, QComboBox, QDoubleSpinBox,
     QDateEdit, QGroupBox, QMessageBox, QSpinBox, QWidget, QScrollArea,
-    QCheckBox, QTableWidget, QTableWidgetItem, QHeaderView
+    QCheckBox, QHeaderView, QDialogButtonBox, QButtonGroup, QAbstractButton,
+    QTableView, QStyledItemDelegate, QStyleOptionButton, QStyle, QApplication
+)
+from PySide6.QtCore import (
+    Qt, QDate, QEvent, QSize, QTimer, QSignalBlocker, QAbstractTableModel, QModelIndex,
+    Signal, Slot
 )
-from PySide6.QtCore import Qt, QDate
-from PySide6.QtGui import QColor
+from PySide6.QtGui import QColor, QIcon, QStandardItem, QStandardItemModel
 
+from .constants import (
+    COLOR_SUCCESS, COLOR_WARNING, COLOR_ERROR, COLOR_INFO, COLOR_NEUTRAL,
+    MAPPING_TINT_ALPHA, MAPPING_SAVE_DELAY,
+)
 from .database import Database
 from .utils import get_symbolic_icon
-from .i18n import tr, PRESET_SUBJECTS, get_translated_subjects
-from .subject_matcher import get_auto_suggestions
+from .i18n import tr, get_translated_subjects, get_preset_subject_keys
+from .subject_matcher import get_auto_suggestions_batch
+from .styles import (
+    STYLE_MUTED, STYLE_MUTED_SMALL, STYLE_INFO_SMALL,
+    STYLE_ERROR, STYLE_SUCCESS_SMALL, STYLE_DIALOG_TITLE, STYLE_HERO_TITLE,
+    STYLE_SUBTITLE, STYLE_DIALOG_HEADER, STYLE_CTA_BUTTON, STYLE_PRESET_GRID_SHEET,
+    HTML_SHORTCUT_SECTION, HTML_SHORTCUT_KEY, HTML_SHORTCUT_DESC, legend_swatch,
+)
+
+def _tint(color: str, alpha: int = MAPPING_TINT_ALPHA) -> QColor:
+    tinted = QColor(color)
+    tinted.setAlpha(alpha)
+    return tinted
+
+# Subject mapping row tints by suggestion kind, shared by every row and the legend
+_TINT_HIGH = _tint(COLOR_SUCCESS)
+_TINT_LOW = _tint(COLOR_WARNING)
+_TINT_NEW = _tint(COLOR_INFO)
+_TINT_MANUAL = _tint(COLOR_ERROR)
+
+# Confidence percentage text colors
+_CONFIDENCE_HIGH = QColor(COLOR_SUCCESS)
+_CONFIDENCE_MEDIUM = QColor(COLOR_WARNING)
+_CONFIDENCE_LOW = QColor(COLOR_NEUTRAL)
+
+def _confidence_color(confidence: float) -> QColor:
+    if confidence > 0.8:
+        return _CONFIDENCE_HIGH
+    if confidence > 0.6:
+        return _CONFIDENCE_MEDIUM
+    return _CONFIDENCE_LOW
+
+# Flags for table cells that can be selected but not edited
+_READONLY_ITEM_FLAGS = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+
+def _make_double_spin(
+    low: float, high: float, step: float, value: float, decimals: int = 2
+) -> QDoubleSpinBox:
+    """Create a QDoubleSpinBox fully configured, with signals blocked during setup."""
+    spin = QDoubleSpinBox()
+    with QSignalBlocker(spin):
+        spin.setDecimals(decimals)
+        spin.setRange(low, high)
+        spin.setSingleStep(step)
+        spin.setValue(value)
+    return spin
+
+def _make_grade_spin(value: float = 6.0) -> QDoubleSpinBox:
+    """Grade input: 1-10 in quarter-point steps."""
+    return _make_double_spin(1.0, 10.0, 0.25, value)
+
+def _make_weight_spin(value: float = 1.0) -> QDoubleSpinBox:
+    """Vote weight input: 0.5-3 in half steps."""
+    return _make_double_spin(0.5, 3.0, 0.5, value)
+
+def _make_combo(items: list[str], editable: bool = False) -> QComboBox:
+    """Create a QComboBox pre-filled with items in a single addItems() call."""
+    combo = QComboBox()
+    combo.addItems(items)
+    combo.setEditable(editable)
+    return combo
+
+def _make_button_box(
+    dialog: QDialog,
+    accept_text: str | None = None,
+    accept_icon: str | None = None,
+    cancel_text: str = "Cancel",
+    cancel_icon: str | None = "dialog-cancel",
+) -> QDialogButtonBox:
+    """
+    Build the standard accept/cancel button row for a dialog.
+
+    Pass accept_text=None for a row with only the cancel/close button.
+    The box is wired to dialog.accept() / dialog.reject().
+    """
+    buttons = QDialogButtonBox.StandardButton.Cancel
+    if accept_text is not None:
+        buttons |= QDialogButtonBox.StandardButton.Ok
+    box = QDialogButtonBox(buttons)
+
+    cancel_btn = box.button(QDialogButtonBox.StandardButton.Cancel)
+    cancel_btn.setText(cancel_text)
+    if cancel_icon:
+        cancel_btn.setIcon(get_symbolic_icon(cancel_icon))
+
+    if accept_text is not None:
+        ok_btn = box.button(QDialogButtonBox.StandardButton.Ok)
+        ok_btn.setText(accept_text)
+        if accept_icon:
+            ok_btn.setIcon(get_symbolic_icon(accept_icon))
+        ok_btn.setDefault(True)
+
+    box.accepted.connect(dialog.accept)
+    box.rejected.connect(dialog.reject)
+    return box
+
+def _make_subject_model(
+    subjects: list[str], placeholder: str | None = None, parent=None
+) -> QStandardItemModel:
+    """
+    Build a combo model of subjects (UserRole = subject name) that many
+    combos can share. An optional first placeholder row carries no data.
+    """
+    model = QStandardItemModel(parent)
+    if placeholder is not None:
+        model.appendRow(QStandardItem(placeholder))
+    for subject in subjects:
+        item = QStandardItem(subject)
+        item.setData(subject, Qt.ItemDataRole.UserRole)
+        model.appendRow(item)
+    return model
+
+class _LazyDialog(QDialog):
+    """
+    QDialog that builds its widget tree on first show instead of in __init__.
+
+    Construction is hooked into setVisible() rather than showEvent() so the
+    layout exists before Qt sizes the window. Subclasses implement _setup_ui()
+    and may override _build_ui() to run extra steps after it.
+    """
+
+    _ui_ready = False
+
+    def _ensure_ui(self):
+        """Build the UI if it has not been built yet."""
+        if not self._ui_ready:
+            self._ui_ready = True
+            self._build_ui()
+
+    def _build_ui(self):
+        self._setup_ui()
+
+    def setVisible(self, visible: bool):
+        if visible:
+            self._ensure_ui()
+        super().setVisible(visible)
 
-class AddVoteDialog(QDialog):
+class AddVoteDialog(_LazyDialog):
     """Dialog for adding or editing a vote."""
+
+    # Storage format of vote dates, parsed and formatted on the Python side
+    _DATE_FMT = "%Y-%m-%d"
+    # Vote type -> combo row, in display order
+    _TYPE_INDEX = {"Written": 0, "Oral": 1, "Practical": 2}
     
     def __init__(
         self, 
@@ -32,123 +184,134 @@ class AddVoteDialog(QDialog):
         self._db = db
         self._vote = vote
         self._current_term = current_term
+        self._subjects_version = None
         
         self.setWindowTitle("Edit Vote" if vote else "Add Vote")
         self.setMinimumWidth(350)
-        self._setup_ui()
-        
-        if vote:
-            self._populate_fields()
-    
+
+    def _initial_values(self) -> dict:
+        """Field values for the current vote, or defaults when adding."""
+        vote = self._vote or {}
+        date = QDate.currentDate()
+        if vote.get("date"):
+            try:
+                date = QDate(datetime.strptime(vote["date"], self._DATE_FMT).date())
+            except ValueError:
+                pass
+        return {
+            "subject": vote.get("subject", ""),
+            "grade": vote.get("grade", 6.0),
+            "type": vote.get("type", "Written"),
+            "term": vote.get("term", 1) if vote else self._current_term,
+            "date": date,
+            "description": vote.get("description", ""),
+            "weight": vote.get("weight", 1.0),
+        }
+
     def _setup_ui(self):
+        # Widgets are created with their final values: the vote's when
+        # editing, defaults otherwise
+        values = self._initial_values()
+
         layout = QFormLayout(self)
         layout.setContentsMargins(16, 16, 16, 16)
         layout.setSpacing(12)
         
         # Subject
-        self._subject_combo = QComboBox()
-        self._subject_combo.addItems(self._db.get_subjects())
-        self._subject_combo.setEditable(True)
+        subjects = self._db.get_subjects()
+        self._subject_combo = _make_combo(subjects, editable=True)
+        self._subject_index = {name: i for i, name in enumerate(subjects)}
+        self._subjects_version = self._db.get_subjects_version()
+        self._select_subject(values["subject"])
         layout.addRow("Subject:", self._subject_combo)
         
         # Grade
-        self._grade_spin = QDoubleSpinBox()
-        self._grade_spin.setRange(1.0, 10.0)
-        self._grade_spin.setSingleStep(0.25)
-        self._grade_spin.setValue(6.0)
-        self._grade_spin.setDecimals(2)
+        self._grade_spin = _make_grade_spin(values["grade"])
         layout.addRow("Grade:", self._grade_spin)
         
         # Type
-        self._type_combo = QComboBox()
-        self._type_combo.addItems(["Written", "Oral", "Practical"])
+        self._type_combo = _make_combo(list(self._TYPE_INDEX))
+        self._type_combo.setCurrentIndex(self._TYPE_INDEX.get(values["type"], 0))
         layout.addRow("Type:", self._type_combo)
         
         # Term
-        self._term_combo = QComboBox()
-        self._term_combo.addItems(["1° Term", "2° Term"])
-        self._term_combo.setCurrentIndex(self._current_term - 1)
+        self._term_combo = _make_combo(["1° Term", "2° Term"])
+        self._term_combo.setCurrentIndex(values["term"] - 1)
         layout.addRow("Term:", self._term_combo)
         
         # Date
-        self._date_edit = QDateEdit()
-        self._date_edit.setDate(QDate.currentDate())
+        self._date_edit = QDateEdit(values["date"])
         self._date_edit.setCalendarPopup(True)
         layout.addRow("Date:", self._date_edit)
         
         # Description
-        self._desc_edit = QLineEdit()
+        self._desc_edit = QLineEdit(values["description"])
         self._desc_edit.setPlaceholderText("e.g., Chapter 5 test")
         layout.addRow("Description:", self._desc_edit)
         
         # Weight
-        self._weight_spin = QDoubleSpinBox()
-        self._weight_spin.setRange(0.5, 3.0)
-        self._weight_spin.setSingleStep(0.5)
-        self._weight_spin.setValue(1.0)
+        self._weight_spin = _make_weight_spin(values["weight"])
         layout.addRow("Weight:", self._weight_spin)
         
         # Buttons
-        btn_layout = QHBoxLayout()
-        btn_layout.setSpacing(8)
-        
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.setIcon(get_symbolic_icon("dialog-cancel"))
-        cancel_btn.clicked.connect(self.reject)
-        
-        save_btn = QPushButton("Save")
-        save_btn.setIcon(get_symbolic_icon("document-save"))
-        save_btn.setDefault(True)
-        save_btn.clicked.connect(self.accept)
-        
-        btn_layout.addStretch()
-        btn_layout.addWidget(cancel_btn)
-        btn_layout.addWidget(save_btn)
-        layout.addRow(btn_layout)
-    
-    def _populate_fields(self):
-        if not self._vote:
-            return
-        
-        # Subject
-        idx = self._subject_combo.findText(self._vote.get("subject", ""))
-        if idx >= 0:
-            self._subject_combo.setCurrentIndex(idx)
+        layout.addRow(_make_button_box(self, "Save", "document-save"))
+
+    def _select_subject(self, subject: str):
+        combo = self._subject_combo
+        idx = self._subject_index.get(subject, -1) if subject else 0
+        if 0 <= idx < combo.count():
+            combo.setCurrentIndex(idx)
+            combo.setEditText(combo.itemText(idx))
         else:
-            self._subject_combo.setCurrentText(self._vote.get("subject", ""))
-        
-        # Grade
-        self._grade_spin.setValue(self._vote.get("grade", 6.0))
-        
-        # Type
-        idx = self._type_combo.findText(self._vote.get("type", "Written"))
-        if idx >= 0:
-            self._type_combo.setCurrentIndex(idx)
-        
-        # Term
-        term = self._vote.get("term", 1)
-        self._term_combo.setCurrentIndex(term - 1)
-        
-        # Date
-        if self._vote.get("date"):
-            date = QDate.fromString(self._vote["date"], "yyyy-MM-dd")
-            if date.isValid():
-                self._date_edit.setDate(date)
-        
-        # Description
-        self._desc_edit.setText(self._vote.get("description", ""))
-        
-        # Weight
-        self._weight_spin.setValue(self._vote.get("weight", 1.0))
+            combo.setEditText(subject)
+
+    def reset(self, vote: dict | None = None, current_term: int = 1):
+        """
+        Prepare a reused dialog for another add or edit. The subject list is
+        only reloaded when subjects changed since it was last filled.
+        """
+        self._vote = vote
+        self._current_term = current_term
+        self.setWindowTitle("Edit Vote" if vote else "Add Vote")
+        if not self._ui_ready:
+            return
+
+        version = self._db.get_subjects_version()
+        if version != self._subjects_version:
+            self._subjects_version = version
+            subjects = self._db.get_subjects()
+            self._subject_index = {name: i for i, name in enumerate(subjects)}
+            with QSignalBlocker(self._subject_combo):
+                self._subject_combo.clear()
+                self._subject_combo.addItems(subjects)
+
+        values = self._initial_values()
+        # Restoring values is not user input: keep change signals quiet
+        blockers = [QSignalBlocker(widget) for widget in (
+            self._subject_combo, self._grade_spin, self._type_combo, self._term_combo,
+            self._date_edit, self._desc_edit, self._weight_spin,
+        )]
+        try:
+            self._select_subject(values["subject"])
+            self._grade_spin.setValue(values["grade"])
+            self._type_combo.setCurrentIndex(self._TYPE_INDEX.get(values["type"], 0))
+            self._term_combo.setCurrentIndex(values["term"] - 1)
+            self._date_edit.setDate(values["date"])
+            self._desc_edit.setText(values["description"])
+            self._weight_spin.setValue(values["weight"])
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
     
     def get_vote_data(self) -> dict:
         """Get the entered vote data."""
+        self._ensure_ui()
         return {
             "subject": self._subject_combo.currentText(),
             "grade": self._grade_spin.value(),
             "type": self._type_combo.currentText(),
             "term": self._term_combo.currentIndex() + 1,
-            "date": self._date_edit.date().toString("yyyy-MM-dd"),
+            "date": self._date_edit.date().toPython().strftime(self._DATE_FMT),
             "description": self._desc_edit.text(),
             "weight": self._weight_spin.value()
         }
@@ -173,23 +336,12 @@ class AddSubjectDialog(QDialog):
         layout.addWidget(self._name_edit)
         
         # Buttons
-        btn_layout = QHBoxLayout()
-        btn_layout.setSpacing(8)
-        
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.setIcon(get_symbolic_icon("dialog-cancel"))
-        cancel_btn.clicked.connect(self.reject)
-        
-        add_btn = QPushButton("Add")
-        add_btn.setIcon(get_symbolic_icon("list-add"))
-        add_btn.setDefault(True)
-        add_btn.clicked.connect(self.accept)
-        
-        btn_layout.addStretch()
-        btn_layout.addWidget(cancel_btn)
-        btn_layout.addWidget(add_btn)
-        layout.addLayout(btn_layout)
+        layout.addWidget(_make_button_box(self, "Add", "list-add"))
     
+    def reset(self):
+        """Clear the name field so the dialog can be shown again."""
+        self._name_edit.clear()
+
     def get_name(self) -> str:
         """Get the entered subject name."""
         return self._name_edit.text().strip()
@@ -234,7 +386,7 @@ class EditSubjectDialog(QDialog):
             warning = "This subject has no votes."
         
         warning_label = QLabel(warning)
-        warning_label.setStyleSheet("color: gray;")
+        warning_label.setStyleSheet(STYLE_MUTED)
         warning_label.setWordWrap(True)
         delete_layout.addWidget(warning_label)
         
@@ -246,13 +398,9 @@ class EditSubjectDialog(QDialog):
         layout.addWidget(delete_group)
         
         # Cancel button
-        btn_layout = QHBoxLayout()
-        btn_layout.addStretch()
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.clicked.connect(self.reject)
-        btn_layout.addWidget(cancel_btn)
-        layout.addLayout(btn_layout)
+        layout.addWidget(_make_button_box(self, cancel_icon=None))
     
+    @Slot()
     def _on_rename(self):
         new_name = self._name_edit.text().strip()
         if new_name and new_name != self._subject_name:
@@ -260,6 +408,7 @@ class EditSubjectDialog(QDialog):
             self.new_name = new_name
             self.accept()
     
+    @Slot()
     def _on_delete(self):
         if self._vote_count > 0:
             reply = QMessageBox.warning(
@@ -278,10 +427,13 @@ class EditSubjectDialog(QDialog):
 
 class AddSchoolYearDialog(QDialog):
     """Dialog for adding a new school year."""
+
+    _PREVIEW_FMT = "→ {}/{}"
     
     def __init__(self, existing_years: list, parent=None):
         super().__init__(parent)
-        self._existing_years = set(y["start_year"] for y in existing_years)
+        self._existing_years = frozenset(y["start_year"] for y in existing_years)
+        self._last_year = None
         
         self.setWindowTitle("Add School Year")
         self.setMinimumWidth(280)
@@ -295,7 +447,6 @@ class AddSchoolYearDialog(QDialog):
         layout.addWidget(QLabel("Select start year:"))
         
         # Year selector
-        from datetime import datetime
         current_year = datetime.now().year
         
         year_layout = QHBoxLayout()
@@ -306,38 +457,30 @@ class AddSchoolYearDialog(QDialog):
         year_layout.addWidget(self._year_spin)
         
         self._preview_label = QLabel()
-        self._preview_label.setStyleSheet("color: gray;")
+        self._preview_label.setStyleSheet(STYLE_MUTED)
         year_layout.addWidget(self._preview_label)
         year_layout.addStretch()
         
         layout.addLayout(year_layout)
         
         self._warning_label = QLabel()
-        self._warning_label.setStyleSheet("color: #e74c3c;")
+        self._warning_label.setStyleSheet(STYLE_ERROR)
         layout.addWidget(self._warning_label)
         
         # Buttons
-        btn_layout = QHBoxLayout()
-        btn_layout.setSpacing(8)
-        
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.clicked.connect(self.reject)
-        
-        self._add_btn = QPushButton("Add")
-        self._add_btn.setIcon(get_symbolic_icon("list-add"))
-        self._add_btn.setDefault(True)
-        self._add_btn.clicked.connect(self.accept)
-        
-        btn_layout.addStretch()
-        btn_layout.addWidget(cancel_btn)
-        btn_layout.addWidget(self._add_btn)
-        layout.addLayout(btn_layout)
+        button_box = _make_button_box(self, "Add", "list-add", cancel_icon=None)
+        self._add_btn = button_box.button(QDialogButtonBox.StandardButton.Ok)
+        layout.addWidget(button_box)
         
         self._update_preview()
     
+    @Slot()
     def _update_preview(self):
         year = self._year_spin.value()
-        self._preview_label.setText(f"→ {year}/{year + 1}")
+        if year == self._last_year:
+            return
+        self._last_year = year
+        self._preview_label.setText(self._PREVIEW_FMT.format(year, year + 1))
         
         if year in self._existing_years:
             self._warning_label.setText("This year already exists!")
@@ -346,6 +489,14 @@ class AddSchoolYearDialog(QDialog):
             self._warning_label.setText("")
             self._add_btn.setEnabled(True)
     
+    def reset(self, existing_years: list):
+        """Refresh the taken years and go back to the current year."""
+        self._existing_years = frozenset(y["start_year"] for y in existing_years)
+        self._last_year = None
+        with QSignalBlocker(self._year_spin):
+            self._year_spin.setValue(datetime.now().year)
+        self._update_preview()
+
     def get_start_year(self) -> int:
         """Get the selected start year."""
         return self._year_spin.value()
@@ -357,6 +508,7 @@ class ManageSchoolYearsDialog(QDialog):
         super().__init__(parent)
         self._db = db
         self._changed = False
+        self._add_year_dialog = None
         
         self.setWindowTitle("Manage School Years")
         self.setMinimumWidth(350)
@@ -374,6 +526,7 @@ class ManageSchoolYearsDialog(QDialog):
         self._list = QListWidget()
         from PySide6.QtWidgets import QAbstractItemView
         self._list.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self._list.setUniformItemSizes(True)
         layout.addWidget(self._list)
         
         # Buttons row
@@ -397,37 +550,57 @@ class ManageSchoolYearsDialog(QDialog):
         btn_layout.addStretch()
         
         layout.addLayout(btn_layout)
+        self._list.currentRowChanged.connect(self._update_buttons)
         
         # Close button
-        close_layout = QHBoxLayout()
-        close_layout.addStretch()
-        close_btn = QPushButton("Close")
-        close_btn.clicked.connect(self.accept)
-        close_layout.addWidget(close_btn)
-        layout.addLayout(close_layout)
+        layout.addWidget(_make_button_box(self, cancel_text="Close", cancel_icon=None))
     
     def _refresh_list(self):
-        self._list.clear()
+        from PySide6.QtWidgets import QListWidgetItem
         years = self._db.get_school_years()
-        
-        for year in years:
-            text = year["name"]
-            if year["is_active"]:
-                text += " (active)"
-            
-            from PySide6.QtWidgets import QListWidgetItem
-            item = QListWidgetItem(text)
-            item.setData(Qt.ItemDataRole.UserRole, year["id"])
-            self._list.addItem(item)
-        
-        # Update button states
+        entries = [
+            (year["name"] + " (active)" if year["is_active"] else year["name"], year["id"])
+            for year in years
+        ]
+
+        # Update the existing rows in place instead of clearing, with repaints
+        # and selection signals suspended until the batch is done
+        self._list.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self._list):
+                count = self._list.count()
+                for row, (text, year_id) in enumerate(entries):
+                    if row < count:
+                        item = self._list.item(row)
+                        if item.text() != text:
+                            item.setText(text)
+                        if item.data(Qt.ItemDataRole.UserRole) != year_id:
+                            item.setData(Qt.ItemDataRole.UserRole, year_id)
+                    else:
+                        item = QListWidgetItem(text)
+                        item.setData(Qt.ItemDataRole.UserRole, year_id)
+                        self._list.addItem(item)
+                for row in range(count - 1, len(entries) - 1, -1):
+                    self._list.takeItem(row)
+        finally:
+            self._list.setUpdatesEnabled(True)
+
+        self._update_buttons()
+
+    @Slot()
+    def _update_buttons(self):
         has_selection = self._list.currentRow() >= 0
-        self._delete_btn.setEnabled(has_selection and len(years) > 1)
+        self._delete_btn.setEnabled(has_selection and self._list.count() > 1)
         self._activate_btn.setEnabled(has_selection)
     
+    @Slot()
     def _add_year(self):
         years = self._db.get_school_years()
-        dialog = AddSchoolYearDialog(years, self)
+        dialog = self._add_year_dialog
+        if dialog is None:
+            dialog = self._add_year_dialog = AddSchoolYearDialog(years, self)
+        else:
+            dialog.reset(years)
         
         if dialog.exec() == QDialog.DialogCode.Accepted:
             start_year = dialog.get_start_year()
@@ -435,6 +608,7 @@ class ManageSchoolYearsDialog(QDialog):
                 self._changed = True
                 self._refresh_list()
     
+    @Slot()
     def _delete_year(self):
         item = self._list.currentItem()
         if not item:
@@ -454,6 +628,7 @@ class ManageSchoolYearsDialog(QDialog):
                 self._changed = True
                 self._refresh_list()
     
+    @Slot()
     def _set_active(self):
         item = self._list.currentItem()
         if not item:
@@ -468,14 +643,56 @@ class ManageSchoolYearsDialog(QDialog):
         """Check if any changes were made."""
         return self._changed
 
-class ShortcutsHelpDialog(QDialog):
+# Keyboard shortcuts shown by ShortcutsHelpDialog, grouped by section
+_SHORTCUT_SECTIONS = [
+    ("Global", [
+        ("Ctrl+1-8", "Jump to page"),
+        ("PgUp / PgDown", "Navigate pages"),
+        ("Ctrl+Z", "Undo"),
+        ("Ctrl+Shift+Z", "Redo"),
+        ("?", "Show this help"),
+    ]),
+    ("Votes Page", [
+        ("Ctrl+N", "Add new grade"),
+        ("Enter", "Edit selected"),
+        ("Delete", "Delete selected"),
+        ("1 / 2", "Switch term"),
+    ]),
+    ("Subjects Page", [
+        ("Ctrl+N", "Add new subject"),
+    ]),
+    ("Settings Page", [
+        ("Ctrl+I", "Import data"),
+        ("Ctrl+E", "Export data"),
+    ]),
+    ("Calendar / Report / Statistics", [
+        ("1 / 2", "Switch term"),
+    ]),
+]
+
+def _render_shortcuts_html(sections: list[tuple[str, list[tuple[str, str]]]]) -> str:
+    """Render shortcut sections as one rich-text block of key/description tables."""
+    parts = []
+    for section_name, shortcuts in sections:
+        parts.append(f'<p style="{HTML_SHORTCUT_SECTION}">{escape(section_name)}</p>')
+        parts.append('<table cellspacing="6" cellpadding="0">')
+        for key, desc in shortcuts:
+            parts.append(
+                f'<tr><td style="{HTML_SHORTCUT_KEY}">&nbsp;{escape(key)}&nbsp;</td>'
+                f'<td style="{HTML_SHORTCUT_DESC}">{escape(desc)}</td></tr>'
+            )
+        parts.append("</table>")
+    return "".join(parts)
+
+_SHORTCUTS_HTML = _render_shortcuts_html(_SHORTCUT_SECTIONS)
+
+class ShortcutsHelpDialog(_LazyDialog):
     """Dialog showing keyboard shortcuts help."""
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Keyboard Shortcuts")
         self.setMinimumWidth(450)
-        self._setup_ui()
 
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -484,74 +701,18 @@ class ShortcutsHelpDialog(QDialog):
 
         # Title
         title = QLabel("Keyboard Shortcuts")
-        title.setStyleSheet("font-size: 18px; font-weight: bold;")
+        title.setStyleSheet(STYLE_DIALOG_TITLE)
         layout.addWidget(title)
 
-        # Shortcuts sections
-        sections = [
-            ("Global", [
-                ("Ctrl+1-8", "Jump to page"),
-                ("PgUp / PgDown", "Navigate pages"),
-                ("Ctrl+Z", "Undo"),
-                ("Ctrl+Shift+Z", "Redo"),
-                ("?", "Show this help"),
-            ]),
-            ("Votes Page", [
-                ("Ctrl+N", "Add new grade"),
-                ("Enter", "Edit selected"),
-                ("Delete", "Delete selected"),
-                ("1 / 2", "Switch term"),
-            ]),
-            ("Subjects Page", [
-                ("Ctrl+N", "Add new subject"),
-            ]),
-            ("Settings Page", [
-                ("Ctrl+I", "Import data"),
-                ("Ctrl+E", "Export data"),
-            ]),
-            ("Calendar / Report / Statistics", [
-                ("1 / 2", "Switch term"),
-            ]),
-        ]
-
-        for section_name, shortcuts in sections:
-            section = QGroupBox(section_name)
-            section_layout = QVBoxLayout(section)
-            section_layout.setContentsMargins(12, 8, 12, 8)
-            section_layout.setSpacing(4)
-
-            for key, desc in shortcuts:
-                row = QHBoxLayout()
-                row.setSpacing(12)
-
-                # Style keys as keyboard buttons
-                key_label = QLabel(key)
-                key_label.setStyleSheet("""
-                    background: #e0e0e0;
-                    border: 1px solid #bbb;
-                    border-radius: 4px;
-                    padding: 4px 8px;
-                    font-family: monospace;
-                    font-weight: bold;
-                    color: #333;
-                """)
-
-                desc_label = QLabel(desc)
-                desc_label.setStyleSheet("color: #666;")
-
-                row.addWidget(key_label)
-                row.addWidget(desc_label)
-                row.addStretch()
-
-                row_widget = QWidget()
-                row_widget.setLayout(row)
-                section_layout.addWidget(row_widget)
-
-            layout.addWidget(section)
+        # Static shortcut tables, rendered once at import as a single rich-text label
+        body = QLabel(_SHORTCUTS_HTML)
+        body.setTextFormat(Qt.TextFormat.RichText)
+        body.setTextInteractionFlags(Qt.TextInteractionFlag.TextBrowserInteraction)
+        layout.addWidget(body)
 
         # Close hint
         hint = QLabel("Press ? or Esc to close")
-        hint.setStyleSheet("color: gray; font-size: 11px;")
+        hint.setStyleSheet(STYLE_MUTED_SMALL)
         hint.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(hint)
 
@@ -562,22 +723,28 @@ class ShortcutsHelpDialog(QDialog):
         else:
             super().keyPressEvent(event)
 
-class OnboardingWizard(QDialog):
+class OnboardingWizard(_LazyDialog):
     """First-run wizard to set up school year and subjects."""
 
+    # Checkbox columns in the preset grid
+    _GRID_COLUMNS = 3
+    # Preset counts above this get a scrollable grid (six rows of three)
+    _SCROLL_THRESHOLD = 6 * _GRID_COLUMNS
+    # Checkboxes created per event-loop turn in a scrollable grid; whole rows
+    _CHECKBOX_BATCH = 6 * _GRID_COLUMNS
+
     def __init__(self, db: Database, parent=None):
         super().__init__(parent)
         self._db = db
         self._selected_subjects = set()
-        # Get translated subject names (displayed) and map to English keys (stored)
+        # Translated subject names (displayed) and translated name -> English key map
         self._translated_subjects = get_translated_subjects()
-        # Map translated name -> English key
-        self._subject_map = {tr(s): s for s in PRESET_SUBJECTS}
+        self._subject_map = get_preset_subject_keys()
+        self._translated_subject_set = frozenset(self._translated_subjects)
 
         self.setWindowTitle(tr("Welcome to VoteTracker!"))
         self.setMinimumSize(500, 400)
         self.setModal(True)
-        self._setup_ui()
 
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -586,12 +753,12 @@ class OnboardingWizard(QDialog):
 
         # Welcome header
         title = QLabel(tr("Welcome to VoteTracker!"))
-        title.setStyleSheet("font-size: 24px; font-weight: bold;")
+        title.setStyleSheet(STYLE_HERO_TITLE)
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
 
         subtitle = QLabel(tr("Let's set up your grade tracker in a few simple steps."))
-        subtitle.setStyleSheet("font-size: 14px; color: gray;")
+        subtitle.setStyleSheet(STYLE_SUBTITLE)
         subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(subtitle)
 
@@ -608,7 +775,7 @@ class OnboardingWizard(QDialog):
         year_layout.addWidget(year_label)
 
         year_hint = QLabel(tr("You can manage school years later in Settings."))
-        year_hint.setStyleSheet("color: gray; font-size: 11px;")
+        year_hint.setStyleSheet(STYLE_MUTED_SMALL)
         year_layout.addWidget(year_hint)
 
         layout.addWidget(year_group)
@@ -624,32 +791,41 @@ class OnboardingWizard(QDialog):
 
         # Grid of checkboxes
         from PySide6.QtWidgets import QGridLayout, QFrame as _QFrame
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(_QFrame.Shape.NoFrame)
-        scroll.setMaximumHeight(150)
-
         grid_widget = QWidget()
-        grid = QGridLayout(grid_widget)
-        grid.setSpacing(8)
+        grid_widget.setStyleSheet(STYLE_PRESET_GRID_SHEET)
+        self._grid = QGridLayout(grid_widget)
+        self._grid.setContentsMargins(0, 0, 0, 0)
+        self._grid.setSpacing(8)
 
         self._checkboxes = {}
+        # One non-exclusive group routes every checkbox toggle to a single slot
+        self._subject_group = QButtonGroup(self)
+        self._subject_group.setExclusive(False)
+        self._subject_group.buttonToggled.connect(self._on_subject_toggled)
         existing_subjects = set(self._db.get_subjects())
+        english_key = self._subject_map.get
+        # Presets already in the database, matched by English key or translated name
+        self._already_added = {
+            name for name in self._translated_subjects
+            if name in existing_subjects or english_key(name, name) in existing_subjects
+        }
 
-        for i, translated_name in enumerate(self._translated_subjects):
-            cb = QCheckBox(translated_name)
-            # Check if this subject (by English key) already exists
-            english_key = self._subject_map.get(translated_name, translated_name)
-            if english_key in existing_subjects or translated_name in existing_subjects:
-                cb.setChecked(True)
-                cb.setEnabled(False)
-                cb.setStyleSheet("color: gray;")
-            cb.toggled.connect(lambda checked, s=translated_name: self._on_subject_toggled(s, checked))
-            self._checkboxes[translated_name] = cb
-            grid.addWidget(cb, i // 3, i % 3)
-
-        scroll.setWidget(grid_widget)
-        subjects_layout.addWidget(scroll)
+        scrollable = len(self._translated_subjects) > self._SCROLL_THRESHOLD
+        if scrollable:
+            scroll = QScrollArea()
+            scroll.setWidgetResizable(True)
+            scroll.setFrameShape(_QFrame.Shape.NoFrame)
+            scroll.setMaximumHeight(150)
+            scroll.setWidget(grid_widget)
+            subjects_layout.addWidget(scroll)
+        else:
+            # Few enough presets to show in full without a scroll viewport
+            subjects_layout.addWidget(grid_widget)
+        # Without a scroll area the minimum height below is taken from the
+        # grid, so every row must exist before it is measured
+        self._build_checkbox_batch(
+            0, self._CHECKBOX_BATCH if scrollable else len(self._translated_subjects)
+        )
 
         # Custom subject input
         custom_layout = QHBoxLayout()
@@ -665,7 +841,7 @@ class OnboardingWizard(QDialog):
         subjects_layout.addLayout(custom_layout)
 
         self._custom_list = QLabel("")
-        self._custom_list.setStyleSheet("color: #27ae60; font-size: 11px;")
+        self._custom_list.setStyleSheet(STYLE_SUCCESS_SMALL)
         subjects_layout.addWidget(self._custom_list)
 
         layout.addWidget(subjects_group, 1)
@@ -675,19 +851,53 @@ class OnboardingWizard(QDialog):
         btn_layout.addStretch()
 
         start_btn = QPushButton(tr("Get Started"))
-        start_btn.setStyleSheet("font-size: 14px; padding: 8px 24px;")
+        start_btn.setStyleSheet(STYLE_CTA_BUTTON)
         start_btn.setDefault(True)
         start_btn.clicked.connect(self._finish)
 
         btn_layout.addWidget(start_btn)
         layout.addLayout(btn_layout)
 
-    def _on_subject_toggled(self, subject: str, checked: bool):
+        if not scrollable:
+            # Without a scroll area the grid cannot shrink, so never let the
+            # window be sized (e.g. clamped to the screen) below its content
+            self.setMinimumHeight(max(self.minimumHeight(), layout.minimumSize().height()))
+
+    def _build_checkbox_batch(self, start_index: int, batch_size: int = _CHECKBOX_BATCH):
+        """
+        Create the next batch of preset checkboxes. Remaining batches are
+        deferred to the event loop so the wizard can paint in between.
+        """
+        subjects = self._translated_subjects
+        already_added = self._already_added
+        group = self._subject_group
+        grid = self._grid
+        end = min(start_index + batch_size, len(subjects))
+
+        for i in range(start_index, end):
+            translated_name = subjects[i]
+            cb = QCheckBox(translated_name)
+            if translated_name in already_added:
+                cb.setChecked(True)
+                cb.setEnabled(False)
+                cb.setProperty("presetAdded", True)
+            cb.setProperty("subject_key", translated_name)
+            group.addButton(cb)
+            self._checkboxes[translated_name] = cb
+            grid.addWidget(cb, *divmod(i, self._GRID_COLUMNS))
+
+        if end < len(subjects):
+            QTimer.singleShot(0, self, partial(self._build_checkbox_batch, end, batch_size))
+
+    @Slot(QAbstractButton, bool)
+    def _on_subject_toggled(self, button: QAbstractButton, checked: bool):
+        subject = button.property("subject_key")
         if checked:
             self._selected_subjects.add(subject)
         else:
             self._selected_subjects.discard(subject)
 
+    @Slot()
     def _add_custom_subject(self):
         name = self._custom_input.text().strip()
         if name and name not in self._selected_subjects:
@@ -696,12 +906,13 @@ class OnboardingWizard(QDialog):
             self._update_custom_list()
 
     def _update_custom_list(self):
-        custom = [s for s in self._selected_subjects if s not in self._translated_subjects]
+        custom = [s for s in self._selected_subjects if s not in self._translated_subject_set]
         if custom:
             self._custom_list.setText(tr("Custom:") + " " + ", ".join(sorted(custom)))
         else:
             self._custom_list.setText("")
 
+    @Slot()
     def _finish(self):
         # Add selected subjects (store with translated names)
         existing = set(self._db.get_subjects())
@@ -713,6 +924,131 @@ class OnboardingWizard(QDialog):
         self._db.set_setting("onboarding_complete", "1")
         self.accept()
 
+@dataclass
+class _MappingRow:
+    """One provider subject and the VoteTracker subject it will map to."""
+    source: str
+    target: str | None  # None until a subject is chosen or typed
+    confidence: float
+    tint: QColor
+    confidence_color: QColor  # Foreground for the confidence column
+
+class _SubjectMappingModel(QAbstractTableModel):
+    """Table model for SubjectMappingDialog: source, arrow, target, confidence."""
+
+    TARGET_COLUMN = 2
+
+    def __init__(self, rows: list[_MappingRow], headers: list[str], placeholder: str,
+                 parent=None):
+        super().__init__(parent)
+        self._rows = rows
+        self._headers = headers
+        self._placeholder = placeholder
+
+    def rows(self) -> list[_MappingRow]:
+        return self._rows
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return row.source
+            if column == 1:
+                return "→"
+            if column == self.TARGET_COLUMN:
+                return row.target or self._placeholder
+            return f"{int(row.confidence * 100)}%" if row.confidence > 0 else None
+        if role == Qt.ItemDataRole.EditRole and column == self.TARGET_COLUMN:
+            return row.target
+        if role == Qt.ItemDataRole.BackgroundRole and column == 0:
+            return row.tint
+        if role == Qt.ItemDataRole.ForegroundRole and column == 3:
+            return row.confidence_color
+        if role == Qt.ItemDataRole.TextAlignmentRole and column in (1, 3):
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def flags(self, index):
+        if index.column() == self.TARGET_COLUMN:
+            return _READONLY_ITEM_FLAGS | Qt.ItemFlag.ItemIsEditable
+        return _READONLY_ITEM_FLAGS
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.EditRole or index.column() != self.TARGET_COLUMN:
+            return False
+        target = (value or "").strip() or None
+        row = self._rows[index.row()]
+        if target != row.target:
+            row.target = target
+            self.dataChanged.emit(index, index)
+        return True
+
+class _SubjectComboDelegate(QStyledItemDelegate):
+    """
+    Edits a target cell with an editable combo over a shared subject model.
+    The combo only exists while its cell is being edited.
+
+    With live_commit every text change is pushed to the model at once;
+    otherwise only a pick from the list is, and typed text is committed when
+    the editor closes (Enter, Tab or focus-out).
+    """
+
+    def __init__(self, subject_model: QStandardItemModel, placeholder: str, parent=None,
+                 live_commit: bool = True):
+        super().__init__(parent)
+        self._subject_model = subject_model
+        self._placeholder = placeholder
+        self._live_commit = live_commit
+
+    def createEditor(self, parent, option, index):
+        combo = QComboBox(parent)
+        combo.setModel(self._subject_model)
+        combo.setEditable(True)
+        # Typed text must never be inserted into the shared model
+        combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+        if self._live_commit:
+            # Push every change straight to the model so nothing is lost on save
+            combo.currentTextChanged.connect(self._commit_sender)
+        else:
+            # Half-typed names never reach the model; a pick from the list does
+            combo.activated.connect(self._commit_sender)
+        return combo
+
+    @Slot()
+    def _commit_sender(self):
+        # One slot serves every editor; the sender is the combo that changed
+        self.commitData.emit(self.sender())
+
+    def setEditorData(self, editor, index):
+        target = index.data(Qt.ItemDataRole.EditRole)
+        if target and editor.currentText() == target:
+            return  # Echo of the editor's own commit; keep the cursor where it is
+        with QSignalBlocker(editor):
+            idx = editor.findData(target) if target else 0
+            if idx >= 0:
+                editor.setCurrentIndex(idx)
+            else:
+                editor.setEditText(target)
+
+    def setModelData(self, editor, model, index):
+        text = editor.currentText().strip()
+        model.setData(index, "" if text == self._placeholder else text)
+
 class SubjectMappingDialog(QDialog):
     """Dialog for mapping provider subjects to VoteTracker subjects."""
 
@@ -749,18 +1085,29 @@ class SubjectMappingDialog(QDialog):
             tr("We've auto-suggested matches based on subject names.")
         )
         header.setWordWrap(True)
-        header.setStyleSheet("font-size: 12px; margin-bottom: 8px;")
+        header.setStyleSheet(STYLE_DIALOG_HEADER)
         layout.addWidget(header)
 
+        # Get existing VoteTracker subjects, built once into a model every editor shares
+        vt_subjects = self._db.get_subjects()
+        self._vt_subjects_set = set(vt_subjects)
+        placeholder = tr("-- Create New Subject --")
+        subject_model = _make_subject_model(vt_subjects, placeholder, self)
+
         # Table
-        self._table = QTableWidget()
-        self._table.setColumnCount(4)
-        self._table.setHorizontalHeaderLabels([
-            self._provider_name + " " + tr("Subject"),
-            tr("→"),
-            tr("VoteTracker Subject"),
-            ""
-        ])
+        self._model = _SubjectMappingModel(
+            self._build_rows(vt_subjects),
+            [self._provider_name + " " + tr("Subject"), tr("→"), tr("VoteTracker Subject"), ""],
+            placeholder,
+            self,
+        )
+        self._table = QTableView()
+        self._table.setModel(self._model)
+        self._table.setItemDelegateForColumn(
+            _SubjectMappingModel.TARGET_COLUMN,
+            _SubjectComboDelegate(subject_model, placeholder, self._table),
+        )
+        self._table.setEditTriggers(QTableView.EditTrigger.AllEditTriggers)
         self._table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         self._table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Fixed)
         self._table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
@@ -769,98 +1116,23 @@ class SubjectMappingDialog(QDialog):
         self._table.setColumnWidth(3, 80)
         self._table.verticalHeader().setVisible(False)
 
-        # Get existing VoteTracker subjects
-        vt_subjects = self._db.get_subjects()
-
-        # Populate table with suggestions
-        self._table.setRowCount(len(self._source_subjects))
-        for i, source_subject in enumerate(self._source_subjects):
-            # Provider subject (read-only)
-            source_item = QTableWidgetItem(source_subject)
-            source_item.setFlags(source_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self._table.setItem(i, 0, source_item)
-
-            # Arrow
-            arrow_item = QTableWidgetItem("→")
-            arrow_item.setFlags(arrow_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            arrow_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self._table.setItem(i, 1, arrow_item)
-
-            # VoteTracker subject (dropdown)
-            combo = QComboBox()
-            combo.setEditable(True)
-
-            # Get auto-suggestion
-            suggestion = get_auto_suggestions(source_subject, vt_subjects)
-
-            # Add options to combo
-            combo.addItem(tr("-- Create New Subject --"), None)
-            for vt_subj in vt_subjects:
-                combo.addItem(vt_subj, vt_subj)
-
-            # Set default selection based on suggestion
-            if suggestion["action"] == "map" and suggestion["suggested_match"]:
-                # High confidence match - select it
-                index = combo.findData(suggestion["suggested_match"])
-                if index >= 0:
-                    combo.setCurrentIndex(index)
-                    # Highlight as auto-matched
-                    source_item.setBackground(QColor(39, 174, 96, 30))  # Light green
-            elif suggestion["action"] == "create" and suggestion["suggested_new"]:
-                # Suggest creating new canonical name
-                combo.setEditText(suggestion["suggested_new"])
-                source_item.setBackground(QColor(52, 152, 219, 30))  # Light blue
-            elif suggestion["suggested_match"]:
-                # Low confidence - show suggestion but require manual confirmation
-                index = combo.findData(suggestion["suggested_match"])
-                if index >= 0:
-                    combo.setCurrentIndex(index)
-                source_item.setBackground(QColor(243, 156, 18, 30))  # Light orange
-            else:
-                # No suggestion - manual mapping required
-                if suggestion["suggested_new"]:
-                    combo.setEditText(suggestion["suggested_new"])
-                source_item.setBackground(QColor(231, 76, 60, 30))  # Light red
-
-            self._table.setCellWidget(i, 2, combo)
-
-            # Store reference for later retrieval
-            combo.setProperty("source_subject", source_subject)
-
-            # Confidence indicator
-            if suggestion["confidence"] > 0:
-                conf_text = f"{int(suggestion['confidence'] * 100)}%"
-                conf_item = QTableWidgetItem(conf_text)
-                conf_item.setFlags(conf_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                conf_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-
-                # Color code confidence
-                if suggestion["confidence"] > 0.8:
-                    conf_item.setForeground(QColor(39, 174, 96))  # Green
-                elif suggestion["confidence"] > 0.6:
-                    conf_item.setForeground(QColor(243, 156, 18))  # Orange
-                else:
-                    conf_item.setForeground(QColor(149, 165, 166))  # Gray
-
-                self._table.setItem(i, 3, conf_item)
-
         layout.addWidget(self._table, 1)
 
         # Legend
         legend_layout = QHBoxLayout()
         legend_layout.setSpacing(16)
 
-        def add_legend(color, text):
+        def add_legend(color: QColor, text):
             box = QLabel("  ")
-            box.setStyleSheet(f"background-color: rgba{color}; border: 1px solid #ccc;")
+            box.setStyleSheet(legend_swatch(color.name(QColor.NameFormat.HexArgb)))
             box.setFixedSize(20, 20)
             legend_layout.addWidget(box)
             legend_layout.addWidget(QLabel(text))
 
-        add_legend((39, 174, 96, 30), tr("High confidence"))
-        add_legend((243, 156, 18, 30), tr("Low confidence"))
-        add_legend((52, 152, 219, 30), tr("Create new"))
-        add_legend((231, 76, 60, 30), tr("Manual"))
+        add_legend(_TINT_HIGH, tr("High confidence"))
+        add_legend(_TINT_LOW, tr("Low confidence"))
+        add_legend(_TINT_NEW, tr("Create new"))
+        add_legend(_TINT_MANUAL, tr("Manual"))
         legend_layout.addStretch()
 
         layout.addLayout(legend_layout)
@@ -884,41 +1156,178 @@ class SubjectMappingDialog(QDialog):
 
         layout.addLayout(btn_layout)
 
+    def _build_rows(self, vt_subjects: list[str]) -> list[_MappingRow]:
+        """Turn auto-suggestions into the initial row per provider subject."""
+        rows = []
+        # Match every provider subject in one pass over the normalized targets
+        suggestions = get_auto_suggestions_batch(self._source_subjects, vt_subjects)
+        for source_subject, suggestion in zip(self._source_subjects, suggestions):
+            if suggestion["action"] == "map" and suggestion["suggested_match"]:
+                # High confidence match - select it
+                target, tint = suggestion["suggested_match"], _TINT_HIGH
+            elif suggestion["action"] == "create" and suggestion["suggested_new"]:
+                # Suggest creating new canonical name
+                target, tint = suggestion["suggested_new"], _TINT_NEW
+            elif suggestion["suggested_match"]:
+                # Low confidence - show suggestion but require manual confirmation
+                target, tint = suggestion["suggested_match"], _TINT_LOW
+            else:
+                # No suggestion - manual mapping required
+                target, tint = suggestion["suggested_new"], _TINT_MANUAL
+            confidence = suggestion["confidence"]
+            rows.append(_MappingRow(
+                source_subject, target, confidence, tint, _confidence_color(confidence)
+            ))
+        return rows
+
+    @Slot()
     def _save_mappings(self):
         """Save the mappings and close dialog."""
-        for i in range(self._table.rowCount()):
-            source_item = self._table.item(i, 0)
-            if source_item is None:
-                continue
-            source_subject = source_item.text()
-            widget = self._table.cellWidget(i, 2)
-            if not isinstance(widget, QComboBox):
-                continue
-            combo = widget
-
-            # Get selected or entered value
-            vt_subject = None
-            if combo.currentData() is not None:
-                # Existing subject selected
-                vt_subject = combo.currentData()
-            else:
-                # New subject entered
-                vt_subject = combo.currentText().strip()
-
+        for row in self._model.rows():
+            vt_subject = row.target
             if vt_subject:
-                self._mappings[source_subject] = vt_subject
-                # Save mapping to database (provider-aware)
-                self._db.save_provider_subject_mapping(self._provider_id, source_subject, vt_subject)
+                self._mappings[row.source] = vt_subject
                 # Ensure the VoteTracker subject exists
-                if vt_subject not in self._db.get_subjects():
+                if vt_subject not in self._vt_subjects_set:
                     self._db.add_subject(vt_subject)
+                    self._vt_subjects_set.add(vt_subject)
 
+        # Save all mappings to database in one transaction (provider-aware)
+        self._db.save_provider_subject_mappings(self._provider_id, self._mappings)
         self.accept()
 
     def get_mappings(self) -> dict[str, str]:
         """Get the subject mappings."""
         return self._mappings
 
+class _ProviderMappingModel(QAbstractTableModel):
+    """Table model for ManageSubjectMappingsDialog: source, target, delete."""
+
+    TARGET_COLUMN = 1
+    DELETE_COLUMN = 2
+
+    # Emitted after the user edits a target: (source subject, new target)
+    mappingEdited = Signal(str, str)
+
+    def __init__(self, headers: list[str], parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._rows: list[list[str]] = []  # [source, target], sorted by source
+        self._row_of: dict[str, int] = {}  # source -> row
+
+    def set_mappings(self, mappings: dict[str, str]):
+        self.beginResetModel()
+        self._rows = [[source, target] for source, target in sorted(mappings.items())]
+        self._row_of = {source: i for i, (source, _target) in enumerate(self._rows)}
+        self.endResetModel()
+
+    def source_at(self, row: int) -> str:
+        return self._rows[row][0]
+
+    def row_of(self, source: str) -> int:
+        """Row holding a source subject, or -1 if it isn't listed."""
+        return self._row_of.get(source, -1)
+
+    def remove_row(self, row: int):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._row_of[self._rows[row][0]]
+        del self._rows[row]
+        # Rows below the removed one move up by one
+        for i in range(row, len(self._rows)):
+            self._row_of[self._rows[i][0]] = i
+        self.endRemoveRows()
+
+    def set_target(self, row: int, target: str):
+        """Update a target without reporting it as a user edit."""
+        self._rows[row][1] = target
+        index = self.index(row, self.TARGET_COLUMN)
+        self.dataChanged.emit(index, index)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.column() == self.DELETE_COLUMN:
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def flags(self, index):
+        if index.column() == self.TARGET_COLUMN:
+            return _READONLY_ITEM_FLAGS | Qt.ItemFlag.ItemIsEditable
+        return _READONLY_ITEM_FLAGS
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.EditRole or index.column() != self.TARGET_COLUMN:
+            return False
+        target = (value or "").strip()
+        row = self._rows[index.row()]
+        if not target or target == row[1]:
+            return False
+        row[1] = target
+        self.dataChanged.emit(index, index)
+        self.mappingEdited.emit(row[0], target)
+        return True
+
+class _DeleteButtonDelegate(QStyledItemDelegate):
+    """
+    Paints a delete button in every cell of a column and reports clicks,
+    so the table needs no real QPushButton per row.
+    """
+
+    # Emitted with the row whose button was clicked
+    clicked = Signal(int)
+
+    def __init__(self, text: str, icon: QIcon, parent=None):
+        super().__init__(parent)
+        self._text = text
+        self._icon = icon
+        self._pressed_row = -1
+
+    def paint(self, painter, option, index):
+        button = QStyleOptionButton()
+        button.rect = option.rect.adjusted(2, 2, -2, -2)
+        button.text = self._text
+        button.icon = self._icon
+        button.iconSize = QSize(16, 16)
+        button.state = QStyle.StateFlag.State_Enabled | (
+            QStyle.StateFlag.State_Sunken if index.row() == self._pressed_row
+            else QStyle.StateFlag.State_Raised
+        )
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_PushButton, button, painter, widget)
+
+    def editorEvent(self, event, model, option, index):
+        event_type = event.type()
+        if event_type not in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonRelease):
+            return super().editorEvent(event, model, option, index)
+        if event.button() != Qt.MouseButton.LeftButton:
+            return False
+
+        view = option.widget
+        if event_type == QEvent.Type.MouseButtonPress:
+            self._pressed_row = index.row()
+            if view:
+                view.update(index)
+            return True
+
+        pressed_row, self._pressed_row = self._pressed_row, -1
+        if view:
+            view.update(index)
+        if pressed_row == index.row() and option.rect.contains(event.position().toPoint()):
+            self.clicked.emit(pressed_row)
+        return True
+
 class ManageSubjectMappingsDialog(QDialog):
     """Dialog for viewing and editing existing provider subject mappings."""
 
@@ -935,12 +1344,23 @@ class ManageSubjectMappingsDialog(QDialog):
         self._provider_name = provider_name
         self._db = db
         self._changed = False
+        self._current_mappings: dict[str, str] = {}  # source_subject -> saved vt_subject
+
+        # Edits are saved once typing pauses, not on every keystroke
+        self._pending: dict[str, str] = {}  # source_subject -> new vt_subject
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(MAPPING_SAVE_DELAY)
+        self._save_timer.timeout.connect(self._flush_pending)
+        # Edits naming a subject that doesn't exist yet wait for the close
+        self._held_new: dict[str, str] = {}  # source_subject -> new vt_subject
 
         self.setWindowTitle(tr("Manage {provider} Subject Mappings").format(provider=provider_name))
         self.setMinimumWidth(700)
         self.setMinimumHeight(400)
         self._setup_ui()
-        self._load_mappings()
+        # Fill the table once the event loop runs so the dialog shows at once
+        QTimer.singleShot(0, self, self._load_mappings)
 
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -952,17 +1372,37 @@ class ManageSubjectMappingsDialog(QDialog):
             tr("View and edit how {provider} subjects are mapped to VoteTracker subjects.").format(provider=self._provider_name)
         )
         header.setWordWrap(True)
-        header.setStyleSheet("font-size: 12px; margin-bottom: 8px;")
+        header.setStyleSheet(STYLE_DIALOG_HEADER)
         layout.addWidget(header)
 
+        # Subjects for the target editors, shared by every row
+        vt_subjects = self._db.get_subjects()
+        self._vt_subjects_set = set(vt_subjects)
+        self._subject_model = _make_subject_model(vt_subjects, parent=self)
+
         # Table
-        self._table = QTableWidget()
-        self._table.setColumnCount(3)
-        self._table.setHorizontalHeaderLabels([
-            self._provider_name + " " + tr("Subject"),
-            tr("VoteTracker Subject"),
-            ""
-        ])
+        self._model = _ProviderMappingModel(
+            [self._provider_name + " " + tr("Subject"), tr("VoteTracker Subject"), ""],
+            self,
+        )
+        self._model.mappingEdited.connect(self._on_mapping_changed)
+
+        # One icon for every painted row button and the clear-all button
+        delete_icon = get_symbolic_icon("edit-delete")
+        delete_delegate = _DeleteButtonDelegate(tr("Delete"), delete_icon, self)
+        delete_delegate.clicked.connect(self._on_delete_clicked)
+
+        self._table = QTableView()
+        self._table.setModel(self._model)
+        # Edits are saved as they are committed, so commit only finished names
+        self._target_delegate = _SubjectComboDelegate(
+            self._subject_model, None, self._table, live_commit=False
+        )
+        self._table.setItemDelegateForColumn(
+            _ProviderMappingModel.TARGET_COLUMN, self._target_delegate
+        )
+        self._table.setItemDelegateForColumn(_ProviderMappingModel.DELETE_COLUMN, delete_delegate)
+        self._table.setEditTriggers(QTableView.EditTrigger.AllEditTriggers)
         self._table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         self._table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         self._table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)
@@ -973,7 +1413,7 @@ class ManageSubjectMappingsDialog(QDialog):
 
         # Info label
         self._info_label = QLabel("")
-        self._info_label.setStyleSheet("color: #7f8c8d; font-size: 11px;")
+        self._info_label.setStyleSheet(STYLE_INFO_SMALL)
         layout.addWidget(self._info_label)
 
         # Buttons
@@ -981,7 +1421,7 @@ class ManageSubjectMappingsDialog(QDialog):
         btn_layout.setSpacing(8)
 
         clear_all_btn = QPushButton(tr("Clear All Mappings"))
-        clear_all_btn.setIcon(get_symbolic_icon("edit-delete"))
+        clear_all_btn.setIcon(delete_icon)
         clear_all_btn.clicked.connect(self._clear_all_mappings)
         btn_layout.addWidget(clear_all_btn)
 
@@ -996,80 +1436,90 @@ class ManageSubjectMappingsDialog(QDialog):
     def _load_mappings(self):
         """Load all existing mappings into the table."""
         mappings = self._db.get_all_provider_subject_mappings(self._provider_id)
-        vt_subjects = self._db.get_subjects()
-
-        self._table.setRowCount(len(mappings))
-
-        for i, (source_subject, vt_subject) in enumerate(sorted(mappings.items())):
-            # Provider subject (read-only)
-            source_item = QTableWidgetItem(source_subject)
-            source_item.setFlags(source_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self._table.setItem(i, 0, source_item)
-
-            # VoteTracker subject (dropdown)
-            combo = QComboBox()
-            combo.setEditable(True)
-
-            # Add current and other subjects
-            for vt_subj in vt_subjects:
-                combo.addItem(vt_subj, vt_subj)
+        self._current_mappings = dict(mappings)
+        # One model reset; hold repaints so the view lays out the new rows once
+        self._table.setUpdatesEnabled(False)
+        try:
+            self._model.set_mappings(mappings)
+        finally:
+            self._table.setUpdatesEnabled(True)
+        self._update_info_label()
+
+    def _update_info_label(self):
+        count = self._model.rowCount()
+        if count == 0:
+            self._info_label.setText(tr("No mappings yet. Import grades from {provider} to create mappings.").format(provider=self._provider_name))
+        else:
+            self._info_label.setText(tr("{count} mapping(s)").format(count=count))
 
-            # Set current mapping
-            index = combo.findText(vt_subject)
-            if index >= 0:
-                combo.setCurrentIndex(index)
+    @Slot(str, str)
+    def _on_mapping_changed(self, source_subject: str, new_vt_subject: str):
+        """Handle when a mapping is changed."""
+        self._pending[source_subject] = new_vt_subject
+        self._save_timer.start()
+
+    @Slot()
+    def _flush_pending(self):
+        """Save the mapping edits collected since the last flush."""
+        self._save_timer.stop()
+        pending, self._pending = self._pending, {}
+        changes = {}
+        for source, vt_subject in pending.items():
+            # The latest edit replaces one held back earlier
+            self._held_new.pop(source, None)
+            if self._current_mappings.get(source) == vt_subject:
+                continue
+            if vt_subject in self._vt_subjects_set:
+                changes[source] = vt_subject
             else:
-                # Subject might not exist anymore, just set the text
-                combo.setEditText(vt_subject)
-
-            # Connect change signal
-            combo.currentTextChanged.connect(
-                lambda text, src=source_subject: self._on_mapping_changed(src, text)
-            )
+                self._held_new[source] = vt_subject
 
-            self._table.setCellWidget(i, 1, combo)
+        # Save new mappings (provider-aware)
+        if changes:
+            self._save_changes(changes)
 
-            # Delete button
-            delete_btn = QPushButton(tr("Delete"))
-            delete_btn.setIcon(get_symbolic_icon("edit-delete"))
-            delete_btn.clicked.connect(
-                lambda checked, src=source_subject: self._delete_mapping(src)
-            )
-            self._table.setCellWidget(i, 2, delete_btn)
+    def _resolve_new_subjects(self):
+        """Ask once whether to create the held-back subjects, then save or revert."""
+        held, self._held_new = self._held_new, {}
+        if not held:
+            return
 
-        # Update info label
-        if len(mappings) == 0:
-            self._info_label.setText(tr("No mappings yet. Import grades from {provider} to create mappings.").format(provider=self._provider_name))
+        new_subjects = sorted(set(held.values()))
+        if self._confirm_new_subjects(new_subjects):
+            for name in new_subjects:
+                self._db.add_subject(name)
+                self._vt_subjects_set.add(name)
+                item = QStandardItem(name)
+                item.setData(name, Qt.ItemDataRole.UserRole)
+                self._subject_model.appendRow(item)
+            self._save_changes(held)
         else:
-            self._info_label.setText(tr("{count} mapping(s)").format(count=len(mappings)))
+            # Revert the edits that needed a new subject
+            for source in held:
+                self._reload_row(source)
 
-    def _on_mapping_changed(self, source_subject: str, new_vt_subject: str):
-        """Handle when a mapping is changed."""
-        new_vt_subject = new_vt_subject.strip()
-        if not new_vt_subject:
-            return
+    def _save_changes(self, changes: dict[str, str]):
+        self._db.save_provider_subject_mappings(self._provider_id, changes)
+        self._current_mappings.update(changes)
+        self._changed = True
 
-        current_mapping = self._db.get_provider_subject_mapping(self._provider_id, source_subject)
-        if current_mapping != new_vt_subject:
-            # Ensure the subject exists
-            if new_vt_subject not in self._db.get_subjects():
-                reply = QMessageBox.question(
-                    self,
-                    tr("Create New Subject"),
-                    tr("Subject '{name}' doesn't exist. Create it?").format(name=new_vt_subject),
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                    QMessageBox.StandardButton.Yes
-                )
-                if reply == QMessageBox.StandardButton.Yes:
-                    self._db.add_subject(new_vt_subject)
-                else:
-                    # Revert change
-                    self._reload_row(source_subject)
-                    return
-
-            # Save new mapping (provider-aware)
-            self._db.save_provider_subject_mapping(self._provider_id, source_subject, new_vt_subject)
-            self._changed = True
+    def _confirm_new_subjects(self, names: list[str]) -> bool:
+        if len(names) == 1:
+            text = tr("Subject '{name}' doesn't exist. Create it?").format(name=names[0])
+        else:
+            text = tr("These subjects don't exist. Create them?") + "\n\n" + "\n".join(names)
+        reply = QMessageBox.question(
+            self,
+            tr("Create New Subject"),
+            text,
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.Yes
+        )
+        return reply == QMessageBox.StandardButton.Yes
+
+    @Slot(int)
+    def _on_delete_clicked(self, row: int):
+        self._delete_mapping(self._model.source_at(row))
 
     def _delete_mapping(self, source_subject: str):
         """Delete a subject mapping."""
@@ -1083,40 +1533,60 @@ class ManageSubjectMappingsDialog(QDialog):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
+            self._pending.pop(source_subject, None)
+            self._held_new.pop(source_subject, None)
+            self._current_mappings.pop(source_subject, None)
             self._db.clear_provider_subject_mapping(self._provider_id, source_subject)
             self._changed = True
-            self._load_mappings()
+            row = self._model.row_of(source_subject)
+            if row >= 0:
+                self._model.remove_row(row)
+            self._update_info_label()
 
+    @Slot()
     def _clear_all_mappings(self):
         """Clear all subject mappings."""
-        mappings = self._db.get_all_provider_subject_mappings(self._provider_id)
-        if len(mappings) == 0:
+        count = self._model.rowCount()
+        if count == 0:
             return
 
         reply = QMessageBox.warning(
             self,
             tr("Confirm Clear All"),
-            tr("Delete ALL {count} subject mappings?").format(count=len(mappings)) + "\n" +
+            tr("Delete ALL {count} subject mappings?").format(count=count) + "\n" +
             tr("This won't delete any grades, but future imports will ask for mapping again."),
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.No
         )
 
         if reply == QMessageBox.StandardButton.Yes:
+            self._save_timer.stop()
+            self._pending.clear()
+            self._held_new.clear()
+            self._current_mappings.clear()
             self._db.clear_all_provider_subject_mappings(self._provider_id)
             self._changed = True
-            self._load_mappings()
+            self._model.set_mappings({})
+            self._update_info_label()
 
     def _reload_row(self, source_subject: str):
         """Reload a specific row after reverting changes."""
-        for i in range(self._table.rowCount()):
-            item = self._table.item(i, 0)
-            if item and item.text() == source_subject:
-                current_mapping = self._db.get_provider_subject_mapping(self._provider_id, source_subject)
-                widget = self._table.cellWidget(i, 1)
-                if isinstance(widget, QComboBox) and current_mapping:
-                    widget.setCurrentText(current_mapping)
-                break
+        row = self._model.row_of(source_subject)
+        if row < 0:
+            return
+        current_mapping = self._current_mappings.get(source_subject)
+        if current_mapping:
+            self._model.set_target(row, current_mapping)
+
+    def done(self, result: int):
+        # Commit a target still being typed, save whatever is waiting and
+        # settle the new subjects with a single question
+        editor = self._table.indexWidget(self._table.currentIndex())
+        if editor is not None:
+            self._target_delegate.commitData.emit(editor)
+        self._flush_pending()
+        self._resolve_new_subjects()
+        super().done(result)
 
     def was_changed(self) -> bool:
         """Check if any changes were made."""
@@ -1161,22 +1631,9 @@ class SelectStudentDialog(QDialog):
         layout.addWidget(self._student_combo)
 
         # Buttons
-        btn_layout = QHBoxLayout()
-        btn_layout.setSpacing(8)
-
-        cancel_btn = QPushButton(tr("Cancel"))
-        cancel_btn.setIcon(get_symbolic_icon("dialog-cancel"))
-        cancel_btn.clicked.connect(self.reject)
-
-        select_btn = QPushButton(tr("Select"))
-        select_btn.setIcon(get_symbolic_icon("dialog-ok"))
-        select_btn.setDefault(True)
-        select_btn.clicked.connect(self.accept)
-
-        btn_layout.addStretch()
-        btn_layout.addWidget(cancel_btn)
-        btn_layout.addWidget(select_btn)
-        layout.addLayout(btn_layout)
+        layout.addWidget(
+            _make_button_box(self, tr("Select"), "dialog-ok", cancel_text=tr("Cancel"))
+        )
 
     def get_selected_student_id(self) -> str | None:
         """Get the selected student ID."""
@@ -546,41 +546,82 @@ PRESET_SUBJECTS = [
     "Computer Science", "Religion", "Geography", "Chemistry", "Biology"
 ]
 
+# Detected system language, resolved on first use
+_system_lang: str | None = None
+
 def get_system_language() -> str:
     """Detect system language, return 'it' or 'en'."""
-    try:
-        lang = locale.getdefaultlocale()[0]
-        if lang and lang.startswith("it"):
-            return "it"
-    except Exception:
-        pass
-    return "en"
+    global _system_lang
+    if _system_lang is None:
+        try:
+            # e.g. 'it_IT' on POSIX, 'Italian_Italy' on Windows
+            lang = locale.getlocale()[0] or ""
+        except ValueError:
+            lang = ""
+        _system_lang = "it" if lang.lower().startswith("it") else "en"
+    return _system_lang
+
+# Translation dict of the current language, swapped by _activate()
+_active: dict = TRANSLATIONS["en"]
+# Bumped on every language switch so widgets can skip retranslating
+_lang_version = 0
+
+def _activate(lang: str):
+    """Make lang the current language and bind its translation dict."""
+    global _current_lang, _active, _lang_version
+    _current_lang = lang
+    _active = TRANSLATIONS.get(lang, TRANSLATIONS["en"])
+    _lang_version += 1
 
 def get_language() -> str:
     """Get current language."""
     return _current_lang
 
+def get_language_version() -> int:
+    """Get a counter that changes whenever the language is switched."""
+    return _lang_version
+
 def set_language(lang: str):
     """Set current language ('en' or 'it')."""
-    global _current_lang
     if lang in TRANSLATIONS:
-        _current_lang = lang
+        _activate(lang)
 
 def init_language(db=None):
     """Initialize language from database or system."""
-    global _current_lang
     if db:
         saved = db.get_setting("language")
         if saved in TRANSLATIONS:
-            _current_lang = saved
+            _activate(saved)
             return
-    _current_lang = get_system_language()
+    _activate(get_system_language())
 
 def tr(key: str) -> str:
     """Translate a string to current language."""
-    translations = TRANSLATIONS.get(_current_lang, TRANSLATIONS["en"])
-    return translations.get(key, key)
+    return _active.get(key, key)
+
+def tr_many(keys) -> tuple:
+    """Translate several strings to current language in one call."""
+    get = _active.get
+    return tuple([get(key, key) for key in keys])
+
+# Translated preset subjects, per language
+_subject_cache: dict = {}
 
-def get_translated_subjects() -> list:
+def get_translated_subjects() -> tuple:
     """Get preset subjects translated to current language."""
-    return [tr(s) for s in PRESET_SUBJECTS]
+    subjects = _subject_cache.get(_current_lang)
+    if subjects is None:
+        subjects = tuple(_active.get(s, s) for s in PRESET_SUBJECTS)
+        _subject_cache[_current_lang] = subjects
+    return subjects
+
+# Translated -> English preset subject names, per language
+_subject_key_cache: dict = {}
+
+def get_preset_subject_keys() -> dict:
+    """Get the translated -> English map of preset subjects for current language."""
+    keys = _subject_key_cache.get(_current_lang)
+    if keys is None:
+        keys = {_active.get(s, s): s for s in PRESET_SUBJECTS}
+        _subject_key_cache[_current_lang] = keys
+    return keys
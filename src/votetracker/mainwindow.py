@@ -5,7 +5,7 @@ from __future__ import annotations
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QFrame, QStackedWidget
+    QFrame, QStackedWidget, QButtonGroup
 )
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QKeyEvent, QIcon
@@ -19,12 +19,12 @@ from .pages import (
     SimulatorPage, CalendarPage, ReportCardPage, StatisticsPage, SettingsPage
 )
 from .dialogs import ShortcutsHelpDialog, OnboardingWizard
-from .i18n import init_language, tr
+from .i18n import init_language, tr, tr_many
 from .sync_provider import SyncProviderRegistry
 from .providers import register_all_providers
 from .constants import (
     SIDEBAR_WIDTH, MIN_WINDOW_WIDTH, MIN_WINDOW_HEIGHT,
-    MARGIN_SMALL, MARGIN_MEDIUM, SPACING_SMALL
+    MARGIN_SMALL, MARGIN_MEDIUM, SPACING_SMALL, REFRESH_DELAY
 )
 
 class MainWindow(QMainWindow):
@@ -41,6 +41,12 @@ class MainWindow(QMainWindow):
 
         self._auto_sync_timer = None
 
+        # Coalesces bursts of change signals into a single refresh
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(REFRESH_DELAY)
+        self._refresh_timer.timeout.connect(self._refresh_all_now)
+
         # Initialize language from db or system
         init_language(self._db)
 
@@ -49,9 +55,8 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(MIN_WINDOW_WIDTH, MIN_WINDOW_HEIGHT)
 
         self._setup_ui()
-        self._connect_signals()
         self._check_onboarding()
-        self._refresh_all()
+        self._refresh_all_now()
         self._auto_login_provider()
         self._start_auto_sync_if_enabled()
 
@@ -61,35 +66,35 @@ class MainWindow(QMainWindow):
 
     @property
     def _dashboard_page(self):
-        return self._pages[0]
+        return self._page(0)
 
     @property
     def _votes_page(self):
-        return self._pages[1]
+        return self._page(1)
 
     @property
     def _subjects_page(self):
-        return self._pages[2]
+        return self._page(2)
 
     @property
     def _simulator_page(self):
-        return self._pages[3]
+        return self._page(3)
 
     @property
     def _calendar_page(self):
-        return self._pages[4]
+        return self._page(4)
 
     @property
     def _report_card_page(self):
-        return self._pages[5]
+        return self._page(5)
 
     @property
     def _statistics_page(self):
-        return self._pages[6]
+        return self._page(6)
 
     @property
     def _settings_page(self):
-        return self._pages[7]
+        return self._page(7)
 
     # ========================================================================
     # UI SETUP
@@ -123,9 +128,13 @@ class MainWindow(QMainWindow):
             ("configure", "Settings"),
         ]
 
+        # One exclusive group dispatches clicks by page index
+        self._nav_group = QButtonGroup(self)
+        self._nav_group.idClicked.connect(self._switch_page)
+
         for idx, (icon_name, label_key) in enumerate(self._nav_keys):
             btn = NavButton(icon_name, tr(label_key))
-            btn.clicked.connect(lambda checked, i=idx: self._switch_page(i))
+            self._nav_group.addButton(btn, idx)
             sidebar_layout.addWidget(btn)
             self._nav_buttons.append(btn)
         
@@ -179,21 +188,20 @@ class MainWindow(QMainWindow):
         # Content stack
         self._stack = QStackedWidget()
 
-        # Create all pages in order (single source of truth)
-        self._pages = [
-            DashboardPage(self._db),
-            VotesPage(self._db, self._undo_manager),
-            SubjectsPage(self._db),
-            SimulatorPage(self._db),
-            CalendarPage(self._db),
-            ReportCardPage(self._db),
-            StatisticsPage(self._db),
-            SettingsPage(self._db)
+        # Page factories in nav order (single source of truth); each page is
+        # built and added to the stack on its first visit
+        self._page_factories = [
+            lambda: DashboardPage(self._db),
+            lambda: VotesPage(self._db, self._undo_manager),
+            lambda: SubjectsPage(self._db),
+            lambda: SimulatorPage(self._db),
+            lambda: CalendarPage(self._db),
+            lambda: ReportCardPage(self._db),
+            lambda: StatisticsPage(self._db),
+            lambda: SettingsPage(self._db),
         ]
-
-        # Add all pages to stack
-        for page in self._pages:
-            self._stack.addWidget(page)
+        self._pages: list[QWidget | None] = [None] * len(self._page_factories)
+        self._current_page = 0
 
         main_layout.addWidget(self._stack, 1)
         
@@ -203,20 +211,33 @@ class MainWindow(QMainWindow):
         # Start on dashboard
         self._switch_page(0)
     
-    def _connect_signals(self):
-        """Connect page signals."""
-        self._votes_page.vote_changed.connect(self._refresh_all)
-        self._subjects_page.subject_changed.connect(self._refresh_all)
-        self._settings_page.data_imported.connect(self._refresh_all)
-        self._settings_page.school_year_changed.connect(self._on_school_year_changed)
-        self._settings_page.language_changed.connect(self._on_language_changed)
+    def _page(self, index: int) -> QWidget:
+        """Get the page at index, creating it on first use."""
+        page = self._pages[index]
+        if page is None:
+            page = self._page_factories[index]()
+            self._pages[index] = page
+            self._stack.addWidget(page)
+            self._connect_signals(page)
+        return page
+
+    def _connect_signals(self, page: QWidget):
+        """Connect the signals of a newly created page."""
+        if isinstance(page, VotesPage):
+            page.vote_changed.connect(self._refresh_all)
+        elif isinstance(page, SubjectsPage):
+            page.subject_changed.connect(self._refresh_all)
+        elif isinstance(page, SettingsPage):
+            page.data_imported.connect(self._refresh_all)
+            page.school_year_changed.connect(self._on_school_year_changed)
+            page.language_changed.connect(self._on_language_changed)
 
     def _check_onboarding(self):
         """Show onboarding wizard if first run."""
         if self._db.get_setting("onboarding_complete") != "1":
             wizard = OnboardingWizard(self._db, self)
             wizard.exec()
-            self._refresh_all()
+            self._refresh_all_now()
 
     def _auto_login_provider(self):
         """Auto-login to active sync provider if enabled."""
@@ -296,21 +317,25 @@ class MainWindow(QMainWindow):
     
     def _switch_page(self, index: int):
         """Switch to a page by index."""
-        self._stack.setCurrentIndex(index)
-
-        for i, btn in enumerate(self._nav_buttons):
-            btn.setChecked(i == index)
+        self._stack.setCurrentWidget(self._page(index))
+        self._current_page = index
+        self._nav_buttons[index].setChecked(True)
 
         self._refresh_current_page()
     
     def _refresh_current_page(self):
         """Refresh the currently visible page."""
-        page = self._pages[self._stack.currentIndex()]
+        page = self._pages[self._current_page]
         if hasattr(page, 'refresh'):
             page.refresh()
     
     def _refresh_all(self):
+        """Schedule a refresh of all data displays (bursts collapse into one)."""
+        self._refresh_timer.start()
+
+    def _refresh_all_now(self):
         """Refresh all data displays using optimized single-query approach."""
+        self._refresh_timer.stop()
         # Single database query instead of N+2 queries
         stats = self._db.get_grade_statistics()
 
@@ -348,8 +373,9 @@ class MainWindow(QMainWindow):
     def _on_language_changed(self):
         """Handle language change - update all UI text."""
         # Update navigation buttons
-        for btn, (_, label_key) in zip(self._nav_buttons, self._nav_keys):
-            btn.set_label(tr(label_key))
+        labels = tr_many(label_key for _, label_key in self._nav_keys)
+        for btn, label in zip(self._nav_buttons, labels):
+            btn.set_label(label)
 
         # Update sidebar titles
         self._stats_title.setText(tr("Quick Stats"))
@@ -360,14 +386,12 @@ class MainWindow(QMainWindow):
 
     def _next_page(self):
         """Switch to next page (wraps around)."""
-        current = self._stack.currentIndex()
-        next_idx = (current + 1) % self._stack.count()
+        next_idx = (self._current_page + 1) % len(self._pages)
         self._switch_page(next_idx)
 
     def _prev_page(self):
         """Switch to previous page (wraps around)."""
-        current = self._stack.currentIndex()
-        prev_idx = (current - 1) % self._stack.count()
+        prev_idx = (self._current_page - 1) % len(self._pages)
         self._switch_page(prev_idx)
 
     def _on_undo_state_changed(self):
@@ -447,6 +471,7 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """Handle window close event."""
-        # Close database connection
+        # Drop any pending refresh, then close database connection
+        self._refresh_timer.stop()
         self._db.close()
         event.accept()
@@ -14,7 +14,7 @@ from PySide6.QtGui import QKeyEvent, QPainter, QBrush
 from ..database import Database
 from ..utils import calc_average, get_status_color, get_grade_style, StatusColors
 from ..widgets import TermToggle
-from ..i18n import tr
+from ..i18n import tr, tr_many
 
 class GradeCalendar(QCalendarWidget):
     """Custom calendar widget that highlights dates with grades."""
@@ -260,8 +260,9 @@ class CalendarPage(QWidget):
         self._title.setText(tr("Calendar"))
         self._grades_group.setTitle(tr("Grades"))
         self._legend_label.setText(tr("Legend:"))
-        for key, lbl in self._legend_items:
-            lbl.setText(tr(key))
+        labels = tr_many(key for key, _ in self._legend_items)
+        for (_, lbl), text in zip(self._legend_items, labels):
+            lbl.setText(text)
 
         # Update term toggle
         self._term_toggle.set_term(self._db.get_current_term())
@@ -4,6 +4,9 @@ Shows overview statistics and subject cards.
 """
 from __future__ import annotations
 
+from datetime import datetime
+from functools import lru_cache
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGroupBox,
     QScrollArea, QGridLayout, QFrame
@@ -11,9 +14,9 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt
 
 from ..database import Database
-from ..utils import calc_average, get_grade_style
+from ..utils import calc_average, calc_type_averages, get_grade_style
 from ..widgets import DashboardSubjectCard
-from ..i18n import tr
+from ..i18n import tr, tr_many, get_language_version
 from ..styles import (
     STYLE_PAGE_TITLE, STYLE_STAT_VALUE, STYLE_MUTED, STYLE_MUTED_CAPTION,
     STYLE_MUTED_SMALL, STYLE_MUTED_ITALIC_SMALL, STYLE_EMPTY_STATE,
@@ -25,14 +28,90 @@ from ..constants import (
     SPACING_SMALL, SPACING_LARGE, SPACING_XLARGE,
 )
 
+@lru_cache(maxsize=512)
+def _format_date(date_str: str) -> str:
+    """Format a YYYY-MM-DD date as DD/MM/YYYY, passing anything else through."""
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d").strftime("%d/%m/%Y")
+    except ValueError:
+        return date_str
+
+class _RecentGradeItem(QFrame):
+    """One row of the Recent Grades list, updated in place on refresh."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._grade_style = None
+        self.setFrameShape(QFrame.Shape.StyledPanel)
+        item_layout = QHBoxLayout(self)
+        item_layout.setContentsMargins(8, 6, 8, 6)
+        item_layout.setSpacing(SPACING_LARGE)
+
+        # Subject name
+        self._subject_label = QLabel()
+        self._subject_label.setStyleSheet(STYLE_BOLD)
+        self._subject_label.setMinimumWidth(120)
+        item_layout.addWidget(self._subject_label)
+
+        # Grade value
+        self._grade_label = QLabel()
+        self._grade_label.setFixedWidth(50)
+        self._grade_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        item_layout.addWidget(self._grade_label)
+
+        # Vote type
+        self._type_label = QLabel()
+        self._type_label.setStyleSheet(STYLE_MUTED)
+        self._type_label.setFixedWidth(80)
+        item_layout.addWidget(self._type_label)
+
+        # Date
+        self._date_label = QLabel()
+        self._date_label.setStyleSheet(STYLE_MUTED_SMALL)
+        self._date_label.setFixedWidth(80)
+        item_layout.addWidget(self._date_label)
+
+        # Description; left empty it takes the free space like a stretch
+        self._desc_label = QLabel()
+        self._desc_label.setStyleSheet(STYLE_MUTED_ITALIC_SMALL)
+        self._desc_label.setWordWrap(False)
+        item_layout.addWidget(self._desc_label, 1)
+
+    def set_vote(self, vote: dict):
+        self._subject_label.setText(vote.get('subject', ''))
+
+        grade = vote.get('grade', 0)
+        self._grade_label.setText(f"{grade:.2f}" if grade > 0 else "+/-")
+        grade_style = grade_cell(get_grade_style(grade))
+        if grade_style != self._grade_style:
+            self._grade_style = grade_style
+            self._grade_label.setStyleSheet(grade_style)
+
+        vote_type = vote.get('type', '')
+        self._type_label.setText(tr(vote_type) if vote_type else "-")
+
+        date_str = vote.get('date', '')
+        self._date_label.setText(_format_date(date_str) if date_str else "-")
+
+        self._desc_label.setText(vote.get('description', '') or "")
+
 class DashboardPage(QWidget):
     """Dashboard page with statistics overview."""
+
+    RECENT_GRADES = 6  # Rows shown in the Recent Grades list
+    CARD_COLUMNS = 3   # Subject cards per grid row
     
     def __init__(self, db: Database, parent=None):
         super().__init__(parent)
         self._db = db
         self._current_term = None  # None = all terms
+        # Widgets reused across refreshes
+        self._recent_items: list[_RecentGradeItem] = []
+        self._recent_separators: list[QFrame] = []
+        self._cards: dict[str, DashboardSubjectCard] = {}
+        self._card_order: list[str] = []
         self._setup_ui()
+        self._lang_version = get_language_version()
     
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -75,6 +154,11 @@ class DashboardPage(QWidget):
         self._recent_container.setSpacing(SPACING_SMALL)
         recent_layout.addLayout(self._recent_container)
 
+        self._recent_empty = QLabel(tr("No votes recorded yet"))
+        self._recent_empty.setStyleSheet(STYLE_EMPTY_STATE)
+        self._recent_empty.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._recent_empty.hide()
+
         top_section.addWidget(self._recent_group, 2)  # Larger proportion (2x stats)
 
         layout.addLayout(top_section)
@@ -93,6 +177,11 @@ class DashboardPage(QWidget):
         self._subjects_grid.setSpacing(SPACING_LARGE)
         self._subjects_grid.setAlignment(Qt.AlignmentFlag.AlignTop)
         scroll.setWidget(scroll_widget)
+
+        self._subjects_empty = QLabel(tr("No votes recorded yet"))
+        self._subjects_empty.setStyleSheet(STYLE_EMPTY_STATE_LARGE)
+        self._subjects_empty.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._subjects_empty.hide()
         overview_layout.addWidget(scroll)
 
         layout.addWidget(self._overview_group, 1)
@@ -117,108 +206,68 @@ class DashboardPage(QWidget):
         return box, label_widget, value_widget
 
     def _update_recent_grades(self, votes: list):
-        """Update the recent grades widget with latest grades."""
-        # Clear existing items
-        while self._recent_container.count():
-            item = self._recent_container.takeAt(0)
-            if item is not None:
-                widget = item.widget()
-                if widget is not None:
-                    widget.deleteLater()
+        """Update the recent grades widget with latest grades (votes sorted newest first)."""
+        # Detach all items; the pooled widgets stay children of the group
+        container = self._recent_container
+        while container.count():
+            container.takeAt(0)
 
         if not votes:
-            empty = QLabel(tr("No votes recorded yet"))
-            empty.setStyleSheet(STYLE_EMPTY_STATE)
-            empty.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self._recent_container.addWidget(empty)
+            for widget in self._recent_items + self._recent_separators:
+                widget.hide()
+            container.addWidget(self._recent_empty)
+            self._recent_empty.show()
             return
+        self._recent_empty.hide()
 
-        # Sort votes by date (most recent first)
-        sorted_votes = sorted(votes, key=lambda v: v.get('date', ''), reverse=True)
+        # get_votes() already returns the most recent votes first
+        recent_votes = votes[:self.RECENT_GRADES]
 
-        # Show last 6 grades
-        recent_votes = sorted_votes[:6]
+        while len(self._recent_items) < len(recent_votes):
+            self._recent_items.append(_RecentGradeItem())
+            separator = QFrame()
+            separator.setFrameShape(QFrame.Shape.HLine)
+            separator.setFrameShadow(QFrame.Shadow.Plain)
+            separator.setFixedHeight(1)
+            separator.setStyleSheet(STYLE_SEPARATOR)
+            self._recent_separators.append(separator)
 
         # Add top stretch
-        self._recent_container.addStretch(1)
+        container.addStretch(1)
 
+        last = len(recent_votes) - 1
         for i, vote in enumerate(recent_votes):
-            item = self._create_recent_grade_item(vote)
-            self._recent_container.addWidget(item)
-
-            # Add separator between items (but not after the last one)
-            if i < len(recent_votes) - 1:
-                separator = QFrame()
-                separator.setFrameShape(QFrame.Shape.HLine)
-                separator.setFrameShadow(QFrame.Shadow.Plain)
-                separator.setFixedHeight(1)
-                separator.setStyleSheet(STYLE_SEPARATOR)
-                self._recent_container.addWidget(separator)
-
-            # Add stretch between items for even distribution
-            if i < len(recent_votes) - 1:
-                self._recent_container.addStretch(1)
+            item = self._recent_items[i]
+            item.set_vote(vote)
+            container.addWidget(item)
+            item.show()
+
+            # Separator and stretch between items (but not after the last one)
+            separator = self._recent_separators[i]
+            if i < last:
+                container.addWidget(separator)
+                separator.show()
+                container.addStretch(1)
+            else:
+                separator.hide()
+
+        for widget in self._recent_items[last + 1:] + self._recent_separators[last + 1:]:
+            widget.hide()
 
         # Add bottom stretch
-        self._recent_container.addStretch(1)
-
-    def _create_recent_grade_item(self, vote: dict) -> QWidget:
-        """Create a widget for a single recent grade item."""
-        item = QFrame()
-        item.setFrameShape(QFrame.Shape.StyledPanel)
-        item_layout = QHBoxLayout(item)
-        item_layout.setContentsMargins(8, 6, 8, 6)
-        item_layout.setSpacing(SPACING_LARGE)
-
-        # Subject name
-        subject_label = QLabel(vote.get('subject', ''))
-        subject_label.setStyleSheet(STYLE_BOLD)
-        subject_label.setMinimumWidth(120)
-        item_layout.addWidget(subject_label)
-
-        # Grade value
-        grade = vote.get('grade', 0)
-        grade_label = QLabel(f"{grade:.2f}" if grade > 0 else "+/-")
-        grade_label.setStyleSheet(grade_cell(get_grade_style(grade)))
-        grade_label.setFixedWidth(50)
-        grade_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        item_layout.addWidget(grade_label)
-
-        # Vote type
-        vote_type = vote.get('type', '')
-        type_label = QLabel(tr(vote_type) if vote_type else "-")
-        type_label.setStyleSheet(STYLE_MUTED)
-        type_label.setFixedWidth(80)
-        item_layout.addWidget(type_label)
+        container.addStretch(1)
 
-        # Date
-        date_str = vote.get('date', '')
-        if date_str:
-            try:
-                from datetime import datetime
-                date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-                formatted_date = date_obj.strftime("%d/%m/%Y")
-            except (ValueError, TypeError):
-                formatted_date = date_str
-        else:
-            formatted_date = "-"
-
-        date_label = QLabel(formatted_date)
-        date_label.setStyleSheet(STYLE_MUTED_SMALL)
-        date_label.setFixedWidth(80)
-        item_layout.addWidget(date_label)
-
-        # Description (if any)
-        description = vote.get('description', '')
-        if description:
-            desc_label = QLabel(description)
-            desc_label.setStyleSheet(STYLE_MUTED_ITALIC_SMALL)
-            desc_label.setWordWrap(False)
-            item_layout.addWidget(desc_label, 1)
-        else:
-            item_layout.addStretch(1)
-
-        return item
+    def _retranslate(self):
+        """Update the static labels to the current language."""
+        self._title.setText(tr("Dashboard"))
+        self._stats_group.setTitle(tr("Statistics"))
+        self._recent_group.setTitle(tr("Recent Grades"))
+        self._overview_group.setTitle(tr("Subjects Overview"))
+        for (label_w, _), text in zip(self._stat_boxes.values(), tr_many(self._stat_boxes)):
+            label_w.setText(text)
+        empty_text = tr("No votes recorded yet")
+        self._recent_empty.setText(empty_text)
+        self._subjects_empty.setText(empty_text)
 
     def set_term_filter(self, term: int | None = None):
         """Set term filter (None for all terms)."""
@@ -227,21 +276,23 @@ class DashboardPage(QWidget):
     def refresh(self):
         """Refresh all dashboard data."""
         # Update labels for language changes
-        self._title.setText(tr("Dashboard"))
-        self._stats_group.setTitle(tr("Statistics"))
-        self._recent_group.setTitle(tr("Recent Grades"))
-        self._overview_group.setTitle(tr("Subjects Overview"))
-        for key, (label_w, _) in self._stat_boxes.items():
-            label_w.setText(tr(key))
+        if self._lang_version != get_language_version():
+            self._lang_version = get_language_version()
+            self._retranslate()
 
+        # One query for the whole term; per-subject lists are bucketed here
         votes = self._db.get_votes(term=self._current_term)
-        subjects_with_votes = self._db.get_subjects_with_votes(term=self._current_term)
+        by_subject: dict[str, list[dict]] = {}
+        for vote in votes:
+            by_subject.setdefault(vote["subject"], []).append(vote)
+        subjects_with_votes = sorted(by_subject)
 
         avg = calc_average(votes)
-        failing = sum(
-            1 for s in subjects_with_votes
-            if calc_average(self._db.get_votes(s, term=self._current_term)) < 6
-        )
+        subject_avgs = {
+            subject: calc_type_averages(subject_votes)
+            for subject, subject_votes in by_subject.items()
+        }
+        failing = sum(1 for avg_s, _, _ in subject_avgs.values() if avg_s < 6)
 
         # Update stats values
         _, avg_val = self._stat_boxes["Overall Average"]
@@ -263,37 +314,38 @@ class DashboardPage(QWidget):
         # Update recent grades
         self._update_recent_grades(votes)
 
-        # Clear subjects grid
-        while self._subjects_grid.count():
-            item = self._subjects_grid.takeAt(0)
-            if item is not None:
-                widget = item.widget()
-                if widget is not None:
-                    widget.deleteLater()
-        
+        # Drop the cards of subjects that no longer have votes
+        for subject in [s for s in self._cards if s not in subject_avgs]:
+            card = self._cards.pop(subject)
+            self._subjects_grid.removeWidget(card)
+            card.deleteLater()
+
         if not subjects_with_votes:
-            empty = QLabel(tr("No votes recorded yet"))
-            empty.setStyleSheet(STYLE_EMPTY_STATE_LARGE)
-            empty.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self._subjects_grid.addWidget(empty, 0, 0, 1, 3)
+            self._card_order = []
+            if self._subjects_grid.indexOf(self._subjects_empty) < 0:
+                self._subjects_grid.addWidget(self._subjects_empty, 0, 0, 1, self.CARD_COLUMNS)
+            self._subjects_empty.show()
             return
-        
-        col = 0
-        row = 0
-        for subject in sorted(subjects_with_votes):
-            subject_votes = self._db.get_votes(subject, term=self._current_term)
-            avg_s = calc_average(subject_votes)
-            written_votes = [v for v in subject_votes if v.get("type") == "Written"]
-            oral_votes = [v for v in subject_votes if v.get("type") == "Oral"]
-            written_avg = calc_average(written_votes)
-            oral_avg = calc_average(oral_votes)
-            
-            card = DashboardSubjectCard(
-                subject, avg_s, written_avg, oral_avg, len(subject_votes)
-            )
-            self._subjects_grid.addWidget(card, row, col)
-            
-            col += 1
-            if col >= 3:
-                col = 0
-                row += 1
+        if self._subjects_grid.indexOf(self._subjects_empty) >= 0:
+            self._subjects_grid.removeWidget(self._subjects_empty)
+            self._subjects_empty.hide()
+
+        for subject in subjects_with_votes:
+            avg_s, written_avg, oral_avg = subject_avgs[subject]
+            vote_count = len(by_subject[subject])
+            card = self._cards.get(subject)
+            if card is None:
+                self._cards[subject] = DashboardSubjectCard(
+                    subject, avg_s, written_avg, oral_avg, vote_count
+                )
+            else:
+                card.update_values(subject, avg_s, written_avg, oral_avg, vote_count)
+
+        # Re-place the cards only when the set or order of subjects changed
+        if subjects_with_votes != self._card_order:
+            for card in self._cards.values():
+                self._subjects_grid.removeWidget(card)
+            for index, subject in enumerate(subjects_with_votes):
+                row, col = divmod(index, self.CARD_COLUMNS)
+                self._subjects_grid.addWidget(self._cards[subject], row, col)
+            self._card_order = subjects_with_votes
@@ -8,14 +8,100 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGroupBox,
     QScrollArea, QFrame, QGridLayout
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QKeyEvent, QPainter, QColor, QPen
+from PySide6.QtCore import Qt, QLine, QPoint, QRect, QRectF, QSize
+from PySide6.QtGui import QKeyEvent, QPainter, QColor, QFont, QPen, QPixmap, QPolygon
+from bisect import bisect_right
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 
+from ..constants import COLOR_SUCCESS, COLOR_INFO
 from ..database import Database
 from ..utils import calc_average, get_status_color
 from ..widgets import TermToggle
-from ..i18n import tr
+from ..i18n import tr, tr_many
+from ..styles import chart_bar, bold_colored
+
+# Grade distribution ranges: (label, low, high, color); high is exclusive
+_GRADE_RANGES = (
+    ("2-4", 2, 4, "#c0392b"),
+    ("4-5.5", 4, 5.5, "#e74c3c"),
+    ("5.5-6", 5.5, 6, "#f39c12"),
+    ("6-7", 6, 7, "#27ae60"),
+    ("7-8", 7, 8, "#2ecc71"),
+    ("8-9", 8, 9, "#3498db"),
+    ("9-10", 9, 10.01, "#9b59b6"),
+)
+# The ranges are contiguous: every low edge, then the last high edge
+_GRADE_EDGES = tuple(r[1] for r in _GRADE_RANGES) + (_GRADE_RANGES[-1][2],)
+_GRADE_RANGE_COLORS = tuple(QColor(r[3]) for r in _GRADE_RANGES)
+
+# Trend chart pens and colors, shared by every repaint
+_AXIS_COLOR = QColor(150, 150, 150)
+_GRID_PEN = QPen(_AXIS_COLOR, 1, Qt.PenStyle.DotLine)
+_PASS_COLOR = QColor(COLOR_SUCCESS)
+_PASS_PEN = QPen(_PASS_COLOR, 1, Qt.PenStyle.DashLine)
+_LINE_PEN = QPen(QColor(COLOR_INFO), 2)
+_POINT_PEN = QPen(QColor("white"), 1)
+
+@lru_cache(maxsize=None)
+def _bar_styles(color: str) -> tuple[str, str]:
+    """Bar fill and value label stylesheets for a color, built once per color."""
+    return chart_bar(color), bold_colored(color)
+
+class _BarRow(QWidget):
+    """One labelled bar of a BarChart, updated in place when the data changes."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._color = None
+
+        row = QHBoxLayout(self)
+        row.setContentsMargins(0, 0, 0, 0)
+        row.setSpacing(12)
+
+        # Subject name label - make sure it's visible
+        self._label = QLabel()
+        self._label.setMinimumWidth(150)
+        self._label.setMaximumWidth(200)
+        self._label.setWordWrap(False)
+        row.addWidget(self._label)
+
+        # Bar container
+        bar_container = QFrame()
+        bar_container.setFixedHeight(28)
+        bar_container.setFrameShape(QFrame.Shape.StyledPanel)
+        self._bar_layout = QHBoxLayout(bar_container)
+        self._bar_layout.setContentsMargins(2, 2, 2, 2)
+        self._bar_layout.setSpacing(0)
+
+        # Bar fill; its share of the width is set through the stretch factors
+        self._bar = QFrame()
+        self._bar_layout.addWidget(self._bar)
+        self._bar_layout.addStretch()
+
+        row.addWidget(bar_container, 1)
+
+        # Value label
+        self._value_label = QLabel()
+        self._value_label.setFixedWidth(55)
+        self._value_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        row.addWidget(self._value_label)
+
+    def set_values(self, label: str, value: float, color: str, max_val: float):
+        self._label.setText(label)
+        self._label.setToolTip(label)
+
+        width_percent = (value / max_val) * 100 if max_val > 0 else 0
+        self._bar_layout.setStretch(0, int(width_percent))
+        self._bar_layout.setStretch(1, int(100 - width_percent))
+
+        self._value_label.setText(f"{value:.2f}")
+        if color != self._color:
+            self._color = color
+            fill_style, value_style = _bar_styles(color)
+            self._bar.setStyleSheet(fill_style)
+            self._value_label.setStyleSheet(value_style)
 
 class BarChart(QFrame):
     """Simple horizontal bar chart widget."""
@@ -23,6 +109,7 @@ class BarChart(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._data = []  # List of (label, value, color)
+        self._rows: list[_BarRow] = []  # Reused across set_data calls
         self._setup_ui()
 
     def _setup_ui(self):
@@ -30,270 +117,300 @@ class BarChart(QFrame):
         self._layout.setContentsMargins(0, 0, 0, 0)
         self._layout.setSpacing(6)
 
+        self._empty_label = QLabel(tr("No data"))
+        self._empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._layout.addWidget(self._empty_label)
+
     def set_data(self, data: list):
         """Set chart data. Each item: (label, value, color)"""
-        self._data = data
+        # Same rows as shown already: nothing to update
+        if data and data == self._data:
+            return
+        self._data = list(data)
         self._update_chart()
 
     def _update_chart(self):
-        # Clear existing
-        while self._layout.count():
-            item = self._layout.takeAt(0)
-            w = item.widget() if item is not None else None
-            if w is not None:
-                w.deleteLater()
-
         if not self._data:
-            empty = QLabel(tr("No data"))
-            empty.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self._layout.addWidget(empty)
+            for row in self._rows:
+                row.hide()
+            self._empty_label.setText(tr("No data"))
+            self._empty_label.show()
             return
+        self._empty_label.hide()
 
         max_val = max(d[1] for d in self._data) if self._data else 1
         if max_val == 0:
             max_val = 1
 
-        for label, value, color in self._data:
-            # Create row widget
-            row_widget = QWidget()
-            row = QHBoxLayout(row_widget)
-            row.setContentsMargins(0, 0, 0, 0)
-            row.setSpacing(12)
-
-            # Subject name label - make sure it's visible
-            lbl = QLabel(label)
-            lbl.setMinimumWidth(150)
-            lbl.setMaximumWidth(200)
-            lbl.setWordWrap(False)
-            lbl.setToolTip(label)
-            row.addWidget(lbl)
-
-            # Bar container
-            bar_container = QFrame()
-            bar_container.setFixedHeight(28)
-            bar_container.setFrameShape(QFrame.Shape.StyledPanel)
-            bar_layout = QHBoxLayout(bar_container)
-            bar_layout.setContentsMargins(2, 2, 2, 2)
-            bar_layout.setSpacing(0)
-
-            # Bar fill
-            width_percent = (value / max_val) * 100 if max_val > 0 else 0
-            bar = QFrame()
-            bar.setStyleSheet(f"background: {color}; border-radius: 2px;")
-            bar_layout.addWidget(bar, int(width_percent))
-            bar_layout.addStretch(int(100 - width_percent))
-
-            row.addWidget(bar_container, 1)
-
-            # Value label
-            val_lbl = QLabel(f"{value:.2f}")
-            val_lbl.setFixedWidth(55)
-            val_lbl.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            val_lbl.setStyleSheet(f"font-weight: bold; color: {color};")
-            row.addWidget(val_lbl)
-
-            self._layout.addWidget(row_widget)
+        # Apply every row's text, stretch and style in one batch, polished and
+        # painted once when updates resume
+        self.setUpdatesEnabled(False)
+        try:
+            # Grow the pool only as needed; surplus rows are hidden, not deleted
+            while len(self._rows) < len(self._data):
+                row = _BarRow()
+                self._rows.append(row)
+                self._layout.addWidget(row)
+
+            for row, (label, value, color) in zip(self._rows, self._data):
+                row.set_values(label, value, color, max_val)
+                row.show()
+            for row in self._rows[len(self._data):]:
+                row.hide()
+        finally:
+            self.setUpdatesEnabled(True)
 
 class DistributionChart(QFrame):
-    """Grade distribution histogram."""
+    """Grade distribution histogram, painted directly rather than built from child widgets."""
+
+    MARGIN = 10
+    SPACING = 6
+    BAR_WIDTH = 40
+    BAR_MAX_HEIGHT = 100
+    BAR_MIN_HEIGHT = 3
+    LABEL_HEIGHT = 20
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._data = {}  # {range_label: (count, color)}
-        self._setup_ui()
-
-    def _setup_ui(self):
-        self._layout = QHBoxLayout(self)
-        self._layout.setContentsMargins(10, 10, 10, 10)
-        self._layout.setSpacing(6)
-        self._layout.setAlignment(Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignHCenter)
+        self._counts: list[int] = []  # One count per _GRADE_RANGES entry; empty if no data
+        self._max_count = 1  # Tallest bucket, the bar height scale
 
     def set_data(self, grades: list):
         """Set distribution data from list of grades."""
         if not grades:
-            self._data = {}
-            self._update_chart()
+            self._counts = []
+            self.update()
             return
 
-        # Define ranges
-        ranges = [
-            ("2-4", 2, 4, "#c0392b"),
-            ("4-5.5", 4, 5.5, "#e74c3c"),
-            ("5.5-6", 5.5, 6, "#f39c12"),
-            ("6-7", 6, 7, "#27ae60"),
-            ("7-8", 7, 8, "#2ecc71"),
-            ("8-9", 8, 9, "#3498db"),
-            ("9-10", 9, 10.01, "#9b59b6"),
-        ]
+        # One pass: bisect each grade straight to its range
+        counts = [0] * len(_GRADE_RANGES)
+        for g in grades:
+            i = bisect_right(_GRADE_EDGES, g) - 1
+            if 0 <= i < len(counts):
+                counts[i] += 1
 
-        self._data = {}
-        for label, low, high, color in ranges:
-            count = sum(1 for g in grades if low <= g < high)
-            self._data[label] = (count, color)
+        if counts != self._counts:
+            self._counts = counts
+            self._max_count = max(counts) or 1
+            self.update()
 
-        self._update_chart()
+    def _column_width(self) -> int:
+        metrics = self.fontMetrics()
+        return max(self.BAR_WIDTH, max(metrics.horizontalAdvance(r[0]) for r in _GRADE_RANGES))
 
-    def _update_chart(self):
-        # Clear existing
-        while self._layout.count():
-            item = self._layout.takeAt(0)
-            w = item.widget() if item is not None else None
-            if w is not None:
-                w.deleteLater()
+    def minimumSizeHint(self) -> QSize:
+        columns = len(_GRADE_RANGES)
+        width = columns * (self._column_width() + self.SPACING) - self.SPACING
+        height = 2 * self.LABEL_HEIGHT + 2 * self.SPACING + self.BAR_MAX_HEIGHT
+        frame = 2 * (self.MARGIN + self.frameWidth())
+        return QSize(width + frame, height + frame)
 
-        if not self._data:
-            empty = QLabel(tr("No data"))
-            empty.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self._layout.addWidget(empty)
-            return
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        painter = QPainter(self)
 
-        max_count = max(c for c, _ in self._data.values()) if self._data else 1
-        if max_count == 0:
-            max_count = 1
-
-        for label, (count, color) in self._data.items():
-            col = QVBoxLayout()
-            col.setSpacing(6)
-            col.setContentsMargins(0, 0, 0, 0)
-
-            # Count label at top (fixed position)
-            count_lbl = QLabel(str(count) if count > 0 else "")
-            count_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            count_lbl.setStyleSheet(f"font-weight: bold; color: {color};")
-            count_lbl.setFixedHeight(20)
-            col.addWidget(count_lbl)
-
-            # Add spacer to push bar to bottom
-            col.addStretch()
-
-            # Bar
-            height = int((count / max_count) * 100) if max_count > 0 else 0
-            bar = QFrame()
-            bar.setFixedWidth(40)
-            bar.setFixedHeight(max(height, 3))
-            bar.setStyleSheet(f"background: {color}; border-radius: 3px;")
-            col.addWidget(bar, 0, Qt.AlignmentFlag.AlignCenter)
-
-            # Range label at bottom
-            range_lbl = QLabel(label)
-            range_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            range_lbl.setFixedHeight(20)
-            col.addWidget(range_lbl)
+        if not self._counts:
+            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, tr("No data"))
+            return
 
-            container = QWidget()
-            container.setLayout(col)
-            self._layout.addWidget(container)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        area = self.contentsRect().adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        col_width = self._column_width()
+        total_width = len(self._counts) * (col_width + self.SPACING) - self.SPACING
+        x = area.left() + (area.width() - total_width) // 2
+        bar_bottom = area.bottom() + 1 - self.LABEL_HEIGHT - self.SPACING
+        max_count = self._max_count
+
+        bold_font = QFont(painter.font())
+        bold_font.setBold(True)
+        text_color = self.palette().color(self.foregroundRole())
+
+        painter.setPen(Qt.PenStyle.NoPen)
+        for count, color in zip(self._counts, _GRADE_RANGE_COLORS):
+            height = max(int(count / max_count * self.BAR_MAX_HEIGHT), self.BAR_MIN_HEIGHT)
+            painter.setBrush(color)
+            painter.drawRoundedRect(
+                QRectF(x + (col_width - self.BAR_WIDTH) / 2, bar_bottom - height,
+                       self.BAR_WIDTH, height),
+                3, 3,
+            )
+            x += col_width + self.SPACING
+
+        # Counts along the top, range labels along the bottom
+        x = area.left() + (area.width() - total_width) // 2
+        center = Qt.AlignmentFlag.AlignCenter
+        for (label, _low, _high, _color), count, color in zip(
+            _GRADE_RANGES, self._counts, _GRADE_RANGE_COLORS
+        ):
+            if count > 0:
+                painter.setFont(bold_font)
+                painter.setPen(color)
+                painter.drawText(QRect(x, area.top(), col_width, self.LABEL_HEIGHT), center, str(count))
+            painter.setFont(self.font())
+            painter.setPen(text_color)
+            painter.drawText(
+                QRect(x, area.bottom() + 1 - self.LABEL_HEIGHT, col_width, self.LABEL_HEIGHT),
+                center, label,
+            )
+            x += col_width + self.SPACING
 
 class TrendChart(QFrame):
     """Simple line chart showing grade trends over time."""
 
+    MARGIN = 40
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._data_points = []  # List of (date, grade)
+        # Parallel lists, one entry per vote in date order
+        self._dates: list[str] = []
+        self._grades: list[float] = []
+        self._axis_labels: list[tuple[int, str]] = []  # (point index, formatted date)
+        # Y-axis scale, fixed per data set
+        self._min_grade = 0.0
+        self._max_grade = 10.0
+        self._grade_range = 10.0
+        self._points = None  # Pixel (x, y) per data point; None until laid out
+        self._polyline = QPolygon()  # Trend line through _points, built with them
+        self._background_cache = None
+        self._background_key = None
         self.setMinimumHeight(200)
         self.setFrameShape(QFrame.Shape.StyledPanel)
 
     def set_data(self, votes: list):
         """Set data from list of votes."""
         if not votes:
-            self._data_points = []
+            self._points = None
+            self._dates = []
+            self._grades = []
+            self._axis_labels = []
             self.update()
             return
 
-        # Sort votes by date
-        sorted_votes = sorted(votes, key=lambda v: v.get('date', ''))
-        self._data_points = [
-            (v.get('date', ''), v.get('grade', 0))
-            for v in sorted_votes
-        ]
-        self.update()
-
-    def paintEvent(self, event):
-        """Custom paint to draw the line chart."""
-        super().paintEvent(event)
+        # Sort votes by date, reading each date once and keeping it as the label source
+        keyed = [(v.get('date', ''), v) for v in votes]
+        keyed.sort(key=itemgetter(0))
+        dates = [date for date, _vote in keyed]
+        grades = [vote.get('grade', 0) for _date, vote in keyed]
 
-        if not self._data_points:
-            painter = QPainter(self)
-            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, tr("No data"))
+        # Same series as shown already: keep the cached layout and skip the repaint
+        if dates == self._dates and grades == self._grades:
             return
+        self._dates = dates
+        self._grades = grades
+        self._points = None
 
-        painter = QPainter(self)
+        # X-axis labels (first, last, middle), formatted once per data set
+        count = len(self._dates)
+        indices = [0] + ([count - 1] if count > 1 else []) + ([count // 2] if count > 2 else [])
+        self._axis_labels = [(i, self._format_date(self._dates[i])) for i in indices]
+
+        # Find min/max grades for scaling
+        self._min_grade = max(0, min(grades) - 0.5)
+        self._max_grade = min(10, max(grades) + 0.5)
+        self._grade_range = (self._max_grade - self._min_grade) or 1
+        self.update()
+
+    def resizeEvent(self, event):
+        self._points = None
+        super().resizeEvent(event)
+
+    def _ensure_layout(self) -> list[tuple[float, float]]:
+        """Pixel positions of the data points, recomputed only after a data or size change."""
+        if self._points is None:
+            margin = self.MARGIN
+            width = self.width() - 2 * margin
+            height = self.height() - 2 * margin
+            step = width / max(len(self._grades) - 1, 1)
+            min_grade, grade_range = self._min_grade, self._grade_range
+            self._points = [
+                (margin + step * i, margin + height * (1 - (grade - min_grade) / grade_range))
+                for i, grade in enumerate(self._grades)
+            ]
+            self._polyline = QPolygon([QPoint(int(x), int(y)) for x, y in self._points])
+        return self._points
+
+    def _background(self) -> QPixmap:
+        """
+        Grid, Y-axis labels and passing line, rendered once per size, scale
+        and language and then reused by every repaint.
+        """
+        dpr = self.devicePixelRatioF()
+        pass_label = tr("Pass (6.0)")
+        key = (self.width(), self.height(), dpr, self._min_grade, self._max_grade, pass_label)
+        if key == self._background_key:
+            return self._background_cache
+
+        pixmap = QPixmap(QSize(round(self.width() * dpr), round(self.height() * dpr)))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setFont(self.font())
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Calculate drawing area with margins
-        margin = 40
+        margin = self.MARGIN
         width = self.width() - 2 * margin
         height = self.height() - 2 * margin
+        min_grade, max_grade = self._min_grade, self._max_grade
+        grade_range = self._grade_range
 
-        # Find min/max grades for scaling
-        grades = [d[1] for d in self._data_points]
-        min_grade = max(0, min(grades) - 0.5)
-        max_grade = min(10, max(grades) + 0.5)
-        grade_range = max_grade - min_grade
-        if grade_range == 0:
-            grade_range = 1
-
-        # Draw grid lines with Y-axis labels
-        painter.setPen(QPen(QColor(150, 150, 150), 1, Qt.PenStyle.DotLine))
+        # Draw grid lines in one call, then their Y-axis labels
+        grid_ys = [int(margin + (height * i / 4)) for i in range(5)]
+        painter.setPen(_GRID_PEN)
+        painter.drawLines([QLine(margin, y, margin + width, y) for y in grid_ys])
+
+        painter.setPen(_AXIS_COLOR)
         for i in range(5):
             y = margin + (height * i / 4)
-            painter.drawLine(margin, int(y), margin + width, int(y))
-
-            # Draw Y-axis grade label
             grade_val = max_grade - (grade_range * i / 4)
-            painter.setPen(QColor(150, 150, 150))
             painter.drawText(5, int(y + 5), f"{grade_val:.1f}")
-            painter.setPen(QPen(QColor(150, 150, 150), 1, Qt.PenStyle.DotLine))
 
         # Draw passing threshold (6.0)
         if min_grade <= 6 <= max_grade:
             passing_y = margin + height * (1 - (6 - min_grade) / grade_range)
-            painter.setPen(QPen(QColor("#27ae60"), 1, Qt.PenStyle.DashLine))
+            painter.setPen(_PASS_PEN)
             painter.drawLine(margin, int(passing_y), margin + width, int(passing_y))
             # Label the passing line
-            painter.setPen(QColor("#27ae60"))
-            painter.drawText(margin + width - 50, int(passing_y - 5), tr("Pass (6.0)"))
+            painter.setPen(_PASS_COLOR)
+            painter.drawText(margin + width - 50, int(passing_y - 5), pass_label)
+        painter.end()
 
-        # Calculate points
-        points = []
-        for i, (date, grade) in enumerate(self._data_points):
-            x = margin + (width * i / max(len(self._data_points) - 1, 1))
-            y = margin + height * (1 - (grade - min_grade) / grade_range)
-            points.append((x, y, grade))
+        self._background_cache = pixmap
+        self._background_key = key
+        return pixmap
 
-        # Draw line
+    def paintEvent(self, event):
+        """Custom paint to draw the line chart."""
+        super().paintEvent(event)
+
+        if not self._grades:
+            painter = QPainter(self)
+            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, tr("No data"))
+            return
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._background())
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        points = self._ensure_layout()
+
+        # Draw line as a single polyline
         if len(points) >= 2:
-            painter.setPen(QPen(QColor("#3498db"), 2))
-            for i in range(len(points) - 1):
-                painter.drawLine(
-                    int(points[i][0]), int(points[i][1]),
-                    int(points[i + 1][0]), int(points[i + 1][1])
-                )
+            painter.setPen(_LINE_PEN)
+            painter.drawPolyline(self._polyline)
 
         # Draw points
-        for x, y, grade in points:
-            color = get_status_color(grade)
-            painter.setPen(QPen(QColor("white"), 1))
-            painter.setBrush(color)
+        painter.setPen(_POINT_PEN)
+        for (x, y), grade in zip(points, self._grades):
+            painter.setBrush(get_status_color(grade))
             painter.drawEllipse(int(x) - 3, int(y) - 3, 6, 6)
 
         # Draw X-axis date labels (first, middle, last)
-        painter.setPen(QColor(150, 150, 150))
-        if len(self._data_points) > 0:
-            # First date
-            date_str = self._format_date(self._data_points[0][0])
-            painter.drawText(int(points[0][0]) - 20, self.height() - 15, date_str)
-
-            # Last date
-            if len(self._data_points) > 1:
-                date_str = self._format_date(self._data_points[-1][0])
-                painter.drawText(int(points[-1][0]) - 20, self.height() - 15, date_str)
-
-            # Middle date
-            if len(self._data_points) > 2:
-                mid_idx = len(self._data_points) // 2
-                date_str = self._format_date(self._data_points[mid_idx][0])
-                painter.drawText(int(points[mid_idx][0]) - 20, self.height() - 15, date_str)
+        painter.setPen(_AXIS_COLOR)
+        label_y = self.height() - 15
+        for i, date_str in self._axis_labels:
+            painter.drawText(int(points[i][0]) - 20, label_y, date_str)
 
     def _format_date(self, date_str: str) -> str:
         """Format date string for display."""
@@ -452,8 +569,10 @@ class StatisticsPage(QWidget):
         self._subjects_group.setTitle(tr("Subject Averages"))
         self._best_group.setTitle(tr("Best Subjects"))
         self._worst_group.setTitle(tr("Subjects to Improve"))
-        for key, (label_key, label_widget) in self._stat_label_widgets.items():
-            label_widget.setText(tr(label_key))
+        stat_labels = self._stat_label_widgets.values()
+        texts = tr_many(label_key for label_key, _ in stat_labels)
+        for (_, label_widget), text in zip(stat_labels, texts):
+            label_widget.setText(text)
 
         self._term_toggle.set_term(self._db.get_current_term())
         self._current_term = self._term_toggle.get_term()
@@ -475,7 +594,7 @@ class StatisticsPage(QWidget):
             self._stat_labels["lowest_grade"].setText(f"{min(grades):.2f}")
 
             passing = sum(1 for g in grades if g >= 6)
-            failing = sum(1 for g in grades if g < 6)
+            failing = len(grades) - passing
             self._stat_labels["passing_count"].setText(str(passing))
             self._stat_labels["passing_count"].setStyleSheet(
                 "font-size: 18px; font-weight: bold; color: #27ae60;"
@@ -25,6 +25,7 @@ class SubjectsPage(QWidget):
     def __init__(self, db: Database, parent=None):
         super().__init__(parent)
         self._db = db
+        self._add_dialog: AddSubjectDialog | None = None
         self._setup_ui()
     
     def _setup_ui(self):
@@ -123,7 +124,11 @@ class SubjectsPage(QWidget):
     
     def _add_subject(self):
         """Add a new subject."""
-        dialog = AddSubjectDialog(self)
+        if self._add_dialog is None:
+            self._add_dialog = AddSubjectDialog(self)
+        else:
+            self._add_dialog.reset()
+        dialog = self._add_dialog
 
         if dialog.exec() == QDialog.DialogCode.Accepted:
             name = dialog.get_name()
@@ -30,6 +30,7 @@ class VotesPage(QWidget):
         super().__init__(parent)
         self._db = db
         self._undo_manager = undo_manager
+        self._vote_dialog: AddVoteDialog | None = None
         self._setup_ui()
     
     def _setup_ui(self):
@@ -222,10 +223,20 @@ class VotesPage(QWidget):
             # ID (hidden)
             self._table.setItem(row, 6, QTableWidgetItem(str(vote.get("id", 0))))
     
+    def _get_vote_dialog(self, vote: dict | None, current_term: int) -> AddVoteDialog:
+        """Return the page's vote dialog, created once and reset for each use."""
+        if self._vote_dialog is None:
+            self._vote_dialog = AddVoteDialog(
+                self._db, vote, current_term=current_term, parent=self
+            )
+        else:
+            self._vote_dialog.reset(vote, current_term)
+        return self._vote_dialog
+
     def _add_vote(self):
         """Add a new vote."""
         current_term = self._term_toggle.get_term()
-        dialog = AddVoteDialog(self._db, current_term=current_term, parent=self)
+        dialog = self._get_vote_dialog(None, current_term)
 
         if dialog.exec() == QDialog.DialogCode.Accepted:
             data = dialog.get_vote_data()
@@ -253,9 +264,7 @@ class VotesPage(QWidget):
         if vote:
             previous_data = vote.copy()
             current_term = self._term_toggle.get_term()
-            dialog = AddVoteDialog(
-                self._db, vote, current_term=current_term, parent=self
-            )
+            dialog = self._get_vote_dialog(vote, current_term)
 
             if dialog.exec() == QDialog.DialogCode.Accepted:
                 data = dialog.get_vote_data()
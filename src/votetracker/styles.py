@@ -8,6 +8,10 @@ and keeps pages focused on layout instead of cosmetics.
 Convention:
 - ``STYLE_*`` constants are complete stylesheet strings, ready to pass to
   ``widget.setStyleSheet()``.
+- ``STYLE_*_SHEET`` constants use object-name / property selectors and are
+  set once on a container, so its children need no per-widget stylesheet.
+- ``HTML_*`` constants are inline ``style`` attributes for rich-text labels,
+  limited to the CSS subset Qt's text engine supports.
 - Helper functions build strings that depend on a runtime value (e.g. a color
   computed from a grade).
 - Layout numbers (margins, spacing) live in :mod:`.constants`, not here.
@@ -20,6 +24,10 @@ from __future__ import annotations
 
 STYLE_PAGE_TITLE = "font-size: 20px; font-weight: bold;"
 STYLE_SECTION_TITLE = "font-size: 16px; font-weight: bold;"
+STYLE_DIALOG_TITLE = "font-size: 18px; font-weight: bold;"
+STYLE_HERO_TITLE = "font-size: 24px; font-weight: bold;"
+STYLE_SUBTITLE = "font-size: 14px; color: gray;"
+STYLE_DIALOG_HEADER = "font-size: 12px; margin-bottom: 8px;"
 STYLE_STAT_VALUE = "font-size: 24px; font-weight: bold;"
 STYLE_BOLD = "font-weight: bold;"
 
@@ -31,6 +39,14 @@ STYLE_MUTED = "color: gray;"
 STYLE_MUTED_CAPTION = "color: gray; font-size: 12px;"
 STYLE_MUTED_SMALL = "color: gray; font-size: 11px;"
 STYLE_MUTED_ITALIC_SMALL = "color: gray; font-style: italic; font-size: 11px;"
+STYLE_INFO_SMALL = "color: #7f8c8d; font-size: 11px;"
+
+# ============================================================================
+# STATUS TEXT
+# ============================================================================
+
+STYLE_ERROR = "color: #e74c3c;"
+STYLE_SUCCESS_SMALL = "color: #27ae60; font-size: 11px;"
 
 # ============================================================================
 # EMPTY STATES
@@ -45,6 +61,30 @@ STYLE_EMPTY_STATE_LARGE = "color: gray; font-weight: bold; padding: 40px;"
 
 STYLE_SEPARATOR = "background-color: rgba(128, 128, 128, 0.3);"
 
+# ============================================================================
+# CONTROLS
+# ============================================================================
+
+STYLE_CTA_BUTTON = "font-size: 14px; padding: 8px 24px;"
+
+# ============================================================================
+# CONTAINER SHEETS (selector based)
+# ============================================================================
+
+# Set on the onboarding preset grid; greys out presets already in the database
+STYLE_PRESET_GRID_SHEET = 'QCheckBox[presetAdded="true"] { color: gray; }'
+
+# ============================================================================
+# RICH TEXT (inline style attributes)
+# ============================================================================
+
+HTML_SHORTCUT_SECTION = "font-weight: bold; margin-top: 8px;"
+HTML_SHORTCUT_KEY = (
+    "background-color: #e0e0e0; color: #333; "
+    "font-family: monospace; font-weight: bold;"
+)
+HTML_SHORTCUT_DESC = "color: #666;"
+
 # ============================================================================
 # HELPERS (dynamic styles)
 # ============================================================================
@@ -58,3 +98,18 @@ def grade_cell(grade_style: str) -> str:
     """Compose the grade-color style (from ``utils.get_grade_style``) with the
     standard bold/medium sizing used for grade cells in lists."""
     return grade_style + "font-weight: bold; font-size: 16px;"
+
+
+def legend_swatch(color: str) -> str:
+    """Bordered color swatch for legends; ``color`` may be ``#AARRGGBB``."""
+    return f"background-color: {color}; border: 1px solid #ccc;"
+
+
+def chart_bar(color: str, radius: int = 2) -> str:
+    """Solid rounded fill for a bar in a chart."""
+    return f"background: {color}; border-radius: {radius}px;"
+
+
+def bold_colored(color: str) -> str:
+    """Bold text in ``color``, for chart values and counts."""
+    return f"font-weight: bold; color: {color};"
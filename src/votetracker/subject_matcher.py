@@ -33,24 +33,44 @@ def normalize_subject(subject: str) -> str:
     """Normalize subject name for comparison (lowercase, strip whitespace)."""
     return subject.lower().strip()
 
-def find_best_match(cv_subject: str, vt_subjects: list[str]) -> tuple[str, float] | None:
-    """
-    Find the best matching VoteTracker subject for a ClasseViva subject.
+# Canonical names and keyword lists as parallel tuples, indexed by group
+_CANONICAL_NAMES = tuple(SUBJECT_KEYWORDS)
+_CANONICAL_NORMS = tuple(normalize_subject(name) for name in _CANONICAL_NAMES)
+_KEYWORD_GROUPS = tuple(SUBJECT_KEYWORDS.values())
 
-    Args:
-        cv_subject: ClasseViva subject name
-        vt_subjects: List of existing VoteTracker subject names
 
-    Returns:
-        Tuple of (matched_subject, confidence) or None if no good match
-        Confidence ranges from 0.0 to 1.0
+def _keyword_groups(norm: str) -> frozenset[int]:
+    """Indices of the keyword groups with a keyword contained in a normalized name."""
+    return frozenset(
+        i for i, keywords in enumerate(_KEYWORD_GROUPS)
+        if any(keyword in norm for keyword in keywords)
+    )
+
+
+def _prepare_targets(vt_subjects: list[str]) -> list[tuple]:
     """
-    cv_norm = normalize_subject(cv_subject)
+    Precompute everything find_best_match needs from each VoteTracker subject,
+    so that matching many source subjects normalizes each target only once.
+    """
+    prepared = []
+    for vt_subject in vt_subjects:
+        vt_norm = normalize_subject(vt_subject)
+        canonical = next(
+            (i for i, norm in enumerate(_CANONICAL_NORMS) if norm == vt_norm), None
+        )
+        prepared.append((
+            vt_subject, vt_norm, set(vt_norm.split()), _keyword_groups(vt_norm), canonical
+        ))
+    return prepared
+
+
+def _match_prepared(cv_norm: str, cv_groups: frozenset[int],
+                    targets: list[tuple]) -> tuple[str, float] | None:
     best_match = None
     best_score = 0.0
+    cv_words = set(cv_norm.split())
 
-    for vt_subject in vt_subjects:
-        vt_norm = normalize_subject(vt_subject)
+    for vt_subject, vt_norm, vt_words, vt_groups, canonical in targets:
         score = 0.0
 
         # Exact match
@@ -62,24 +82,14 @@ def find_best_match(cv_subject: str, vt_subjects: list[str]) -> tuple[str, float
             score = 0.9
 
         # Check keyword matches
-        for vt_keywords in SUBJECT_KEYWORDS.values():
-            cv_in_keywords = any(keyword in cv_norm for keyword in vt_keywords)
-            vt_in_keywords = any(keyword in vt_norm for keyword in vt_keywords)
-
-            if cv_in_keywords and vt_in_keywords:
-                score = max(score, 0.85)
-                break
+        if cv_groups & vt_groups:
+            score = max(score, 0.85)
 
         # Check if VT subject is a keyword match for CV subject
-        for canonical, keywords in SUBJECT_KEYWORDS.items():
-            if normalize_subject(vt_subject) == normalize_subject(canonical):
-                if any(keyword in cv_norm for keyword in keywords):
-                    score = max(score, 0.8)
-                    break
+        if canonical is not None and canonical in cv_groups:
+            score = max(score, 0.8)
 
         # Simple word overlap
-        cv_words = set(cv_norm.split())
-        vt_words = set(vt_norm.split())
         if cv_words and vt_words:
             overlap = len(cv_words & vt_words)
             total = len(cv_words | vt_words)
@@ -96,6 +106,21 @@ def find_best_match(cv_subject: str, vt_subjects: list[str]) -> tuple[str, float
 
     return None
 
+def find_best_match(cv_subject: str, vt_subjects: list[str]) -> tuple[str, float] | None:
+    """
+    Find the best matching VoteTracker subject for a ClasseViva subject.
+
+    Args:
+        cv_subject: ClasseViva subject name
+        vt_subjects: List of existing VoteTracker subject names
+
+    Returns:
+        Tuple of (matched_subject, confidence) or None if no good match
+        Confidence ranges from 0.0 to 1.0
+    """
+    cv_norm = normalize_subject(cv_subject)
+    return _match_prepared(cv_norm, _keyword_groups(cv_norm), _prepare_targets(vt_subjects))
+
 def suggest_canonical_name(cv_subject: str) -> str | None:
     """
     Suggest a canonical subject name based on keywords.
@@ -114,21 +139,7 @@ def suggest_canonical_name(cv_subject: str) -> str | None:
 
     return None
 
-def get_auto_suggestions(cv_subject: str, vt_subjects: list[str]) -> dict[str, Any]:
-    """
-    Get auto-suggestion for mapping a ClasseViva subject.
-
-    Args:
-        cv_subject: ClasseViva subject name
-        vt_subjects: List of existing VoteTracker subjects
-
-    Returns:
-        Dict with keys:
-        - suggested_match: Best matching existing subject (or None)
-        - confidence: Match confidence (0.0-1.0)
-        - suggested_new: Suggested new subject name (or None)
-        - action: Recommended action ("map", "create", or "manual")
-    """
+def _suggest(cv_subject: str, targets: list[tuple]) -> dict[str, Any]:
     result = {
         "suggested_match": None,
         "confidence": 0.0,
@@ -136,8 +147,11 @@ def get_auto_suggestions(cv_subject: str, vt_subjects: list[str]) -> dict[str, A
         "action": "manual"
     }
 
+    cv_norm = normalize_subject(cv_subject)
+    cv_groups = _keyword_groups(cv_norm)
+
     # Try to find existing match
-    match = find_best_match(cv_subject, vt_subjects)
+    match = _match_prepared(cv_norm, cv_groups, targets)
     confidence: float = 0.0
     if match is not None:
         result["suggested_match"] = match[0]
@@ -152,10 +166,44 @@ def get_auto_suggestions(cv_subject: str, vt_subjects: list[str]) -> dict[str, A
 
     # If no good existing match, suggest creating a canonical name
     if match is None or confidence < 0.8:
-        canonical = suggest_canonical_name(cv_subject)
-        if canonical:
-            result["suggested_new"] = canonical
+        # First keyword group in declaration order, as in suggest_canonical_name
+        if cv_groups:
+            result["suggested_new"] = _CANONICAL_NAMES[min(cv_groups)]
             if match is None or confidence < 0.7:
                 result["action"] = "create"
 
     return result
+
+def get_auto_suggestions(cv_subject: str, vt_subjects: list[str]) -> dict[str, Any]:
+    """
+    Get auto-suggestion for mapping a ClasseViva subject.
+
+    Args:
+        cv_subject: ClasseViva subject name
+        vt_subjects: List of existing VoteTracker subjects
+
+    Returns:
+        Dict with keys:
+        - suggested_match: Best matching existing subject (or None)
+        - confidence: Match confidence (0.0-1.0)
+        - suggested_new: Suggested new subject name (or None)
+        - action: Recommended action ("map", "create", or "manual")
+    """
+    return _suggest(cv_subject, _prepare_targets(vt_subjects))
+
+def get_auto_suggestions_batch(cv_subjects: list[str], vt_subjects: list[str]) -> list[dict[str, Any]]:
+    """
+    Get auto-suggestions for many ClasseViva subjects at once.
+
+    The VoteTracker subjects are normalized once and shared across all
+    lookups. Each result matches what get_auto_suggestions would return.
+
+    Args:
+        cv_subjects: ClasseViva subject names
+        vt_subjects: List of existing VoteTracker subjects
+
+    Returns:
+        List of suggestion dicts, in the same order as cv_subjects
+    """
+    targets = _prepare_targets(vt_subjects)
+    return [_suggest(cv_subject, targets) for cv_subject in cv_subjects]
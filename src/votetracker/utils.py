@@ -4,6 +4,8 @@ Contains calculation helpers, color utilities, and icon helpers.
 """
 from __future__ import annotations
 
+from functools import lru_cache
+
 from PySide6.QtGui import QColor, QIcon
 from .constants import (
     PASSING_GRADE, GRADE_INSUFFICIENT,
@@ -33,6 +35,35 @@ def calc_average(votes: list[dict]) -> float:
     weights = sum(v.get("weight", 1.0) for v in valid_votes)
     return total / weights if weights > 0 else 0.0
 
+def calc_type_averages(votes: list[dict]) -> tuple[float, float, float]:
+    """
+    Calculate the overall, written and oral averages in a single pass.
+    Same rules as calc_average: 0.00 grades are excluded, weights apply.
+    """
+    total = weights = 0.0
+    written_total = written_weights = 0.0
+    oral_total = oral_weights = 0.0
+    for v in votes:
+        grade = v.get("grade", 0)
+        if grade <= 0:
+            continue
+        weight = v.get("weight", 1.0)
+        total += grade * weight
+        weights += weight
+        vote_type = v.get("type")
+        if vote_type == "Written":
+            written_total += grade * weight
+            written_weights += weight
+        elif vote_type == "Oral":
+            oral_total += grade * weight
+            oral_weights += weight
+
+    return (
+        total / weights if weights > 0 else 0.0,
+        written_total / written_weights if written_weights > 0 else 0.0,
+        oral_total / oral_weights if oral_weights > 0 else 0.0,
+    )
+
 def round_report_card(average: float) -> int:
     """
     Round average to report card grade.
@@ -94,12 +125,14 @@ def get_status_icon_name(average: float) -> str:
 # ICON HELPERS
 # ============================================================================
 
+@lru_cache(maxsize=128)
 def get_symbolic_icon(name: str) -> QIcon:
     """
     Get icon using the new cross-platform icon provider.
     Now optimized for Windows with no emoji fallbacks.
 
-    Returns a QIcon that's never null.
+    Results are cached per name, so every caller shares one QIcon instead
+    of repeating the style/theme lookup. Returns a QIcon that's never null.
     """
     return _get_icon(name)
 
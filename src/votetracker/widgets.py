@@ -90,16 +90,11 @@ class DashboardSubjectCard(QGroupBox):
         parent=None
     ):
         super().__init__(parent)
-        self._setup_ui(subject, average, written_avg, oral_avg, vote_count)
+        self._average_style = None
+        self._setup_ui()
+        self.update_values(subject, average, written_avg, oral_avg, vote_count)
     
-    def _setup_ui(
-        self, 
-        subject: str, 
-        average: float, 
-        written_avg: float, 
-        oral_avg: float,
-        vote_count: int
-    ):
+    def _setup_ui(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(12, 12, 12, 12)
         layout.setSpacing(8)
@@ -108,18 +103,17 @@ class DashboardSubjectCard(QGroupBox):
         header = QHBoxLayout()
         header.setSpacing(8)
         
-        status = StatusIndicator(average)
-        header.addWidget(status)
+        self._status = StatusIndicator(0.0)
+        header.addWidget(self._status)
         
-        name = QLabel(f"<b>{subject}</b>")
-        name.setStyleSheet("font-size: 14px;")
-        header.addWidget(name)
+        self._name_label = QLabel()
+        self._name_label.setStyleSheet("font-size: 14px;")
+        header.addWidget(self._name_label)
         header.addStretch()
         
         # Average
-        avg_label = QLabel(f"<b>{average:.2f}</b>")
-        avg_label.setStyleSheet(get_grade_style(average) + "font-size: 18px;")
-        header.addWidget(avg_label)
+        self._avg_label = QLabel()
+        header.addWidget(self._avg_label)
         
         layout.addLayout(header)
         
@@ -138,11 +132,10 @@ class DashboardSubjectCard(QGroupBox):
         written_box.setSpacing(2)
         w_label = QLabel("Written")
         w_label.setStyleSheet(f"color: {StatusColors.WRITTEN.name()}; font-size: 11px;")
-        written_str = f"<b>{written_avg:.1f}</b>" if written_avg > 0 else "-"
-        w_value = QLabel(written_str)
-        w_value.setStyleSheet(f"color: {StatusColors.WRITTEN.name()};")
+        self._written_value = QLabel()
+        self._written_value.setStyleSheet(f"color: {StatusColors.WRITTEN.name()};")
         written_box.addWidget(w_label)
-        written_box.addWidget(w_value)
+        written_box.addWidget(self._written_value)
         details.addLayout(written_box)
         
         # Oral average
@@ -150,22 +143,43 @@ class DashboardSubjectCard(QGroupBox):
         oral_box.setSpacing(2)
         o_label = QLabel("Oral")
         o_label.setStyleSheet(f"color: {StatusColors.ORAL.name()}; font-size: 11px;")
-        oral_str = f"<b>{oral_avg:.1f}</b>" if oral_avg > 0 else "-"
-        o_value = QLabel(oral_str)
-        o_value.setStyleSheet(f"color: {StatusColors.ORAL.name()};")
+        self._oral_value = QLabel()
+        self._oral_value.setStyleSheet(f"color: {StatusColors.ORAL.name()};")
         oral_box.addWidget(o_label)
-        oral_box.addWidget(o_value)
+        oral_box.addWidget(self._oral_value)
         details.addLayout(oral_box)
         
         details.addStretch()
         
         # Vote count
-        count_label = QLabel(f"{vote_count} votes")
-        count_label.setStyleSheet("color: gray; font-size: 11px;")
-        details.addWidget(count_label)
+        self._count_label = QLabel()
+        self._count_label.setStyleSheet("color: gray; font-size: 11px;")
+        details.addWidget(self._count_label)
         
         layout.addLayout(details)
 
+    def update_values(
+        self,
+        subject: str,
+        average: float,
+        written_avg: float,
+        oral_avg: float,
+        vote_count: int
+    ):
+        """Show new stats, reusing the existing child widgets."""
+        self._status.update_status(average)
+        self._name_label.setText(f"<b>{subject}</b>")
+
+        self._avg_label.setText(f"<b>{average:.2f}</b>")
+        average_style = get_grade_style(average) + "font-size: 18px;"
+        if average_style != self._average_style:
+            self._average_style = average_style
+            self._avg_label.setStyleSheet(average_style)
+
+        self._written_value.setText(f"<b>{written_avg:.1f}</b>" if written_avg > 0 else "-")
+        self._oral_value.setText(f"<b>{oral_avg:.1f}</b>" if oral_avg > 0 else "-")
+        self._count_label.setText(f"{vote_count} votes")
+
 class SubjectCard(QGroupBox):
     """
     Subject card with edit functionality.
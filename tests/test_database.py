@@ -86,6 +86,23 @@ class TestDatabase(unittest.TestCase):
         subjects3 = self.db.get_subjects(force_refresh=True)
         self.assertEqual(subjects1, subjects3)
 
+    def test_subjects_version(self):
+        """Test that the subjects version changes only on subject mutations."""
+        version = self.db.get_subjects_version()
+        self.db.get_subjects()
+        self.assertEqual(self.db.get_subjects_version(), version)
+
+        self.db.add_subject("Math")
+        self.assertNotEqual(self.db.get_subjects_version(), version)
+
+        version = self.db.get_subjects_version()
+        self.db.rename_subject("Math", "Mathematics")
+        self.assertNotEqual(self.db.get_subjects_version(), version)
+
+        version = self.db.get_subjects_version()
+        self.db.delete_subject("Mathematics")
+        self.assertNotEqual(self.db.get_subjects_version(), version)
+
     # ========================================================================
     # SCHOOL YEAR TESTS
     # ========================================================================
@@ -108,6 +125,18 @@ class TestDatabase(unittest.TestCase):
         # Should be equal (from cache)
         self.assertEqual(len(years1), len(years2))
 
+    def test_set_active_school_year_invalidates_cache(self):
+        """Test that changing the active year is visible through the cache."""
+        self.db.add_school_year(2030)
+        years = self.db.get_school_years()  # Prime cache
+        new_year = next(y for y in years if y['start_year'] == 2030)
+        self.assertFalse(new_year['is_active'])
+
+        self.db.set_active_school_year(new_year['id'])
+
+        active = [y for y in self.db.get_school_years() if y['is_active']]
+        self.assertEqual([y['id'] for y in active], [new_year['id']])
+
     # ========================================================================
     # VOTE TESTS
     # ========================================================================
@@ -285,5 +314,20 @@ class TestDatabase(unittest.TestCase):
         assert needed is not None
         self.assertAlmostEqual(needed, 9.0, places=1)
 
+    def test_save_provider_subject_mappings(self):
+        """Test saving several provider subject mappings at once."""
+        self.db.save_provider_subject_mapping("axios", "FISICA", "Old")
+        self.db.save_provider_subject_mappings("axios", {
+            "MATEMATICA": "Math",
+            "FISICA": "Physics",
+        })
+        self.db.save_provider_subject_mappings("classeviva", {})
+
+        self.assertEqual(
+            self.db.get_all_provider_subject_mappings("axios"),
+            {"MATEMATICA": "Math", "FISICA": "Physics"}
+        )
+        self.assertEqual(self.db.get_all_provider_subject_mappings("classeviva"), {})
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,138 @@
+"""
+Unit tests for dialogs (run on the offscreen Qt platform).
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QApplication
+
+from src.votetracker import dialogs
+from src.votetracker.constants import MAPPING_SAVE_DELAY
+from src.votetracker.database import Database
+
+_app = QApplication.instance() or QApplication([])
+
+class TestManageSubjectMappingsDialog(unittest.TestCase):
+    """Test suite for ManageSubjectMappingsDialog."""
+
+    def setUp(self):
+        """Create temporary database with one saved mapping."""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.temp_db.close()
+
+        import src.votetracker.database as db_module
+        self.original_get_db_path = db_module.get_db_path
+        db_module.get_db_path = lambda: self.temp_db.name
+
+        self.db = Database()
+        self.db.add_subject("Math")
+        self.db.save_provider_subject_mapping("axios", "MATEMATICA", "Math")
+        self.subjects = self.db.get_subjects()
+
+        self.dialog = dialogs.ManageSubjectMappingsDialog("axios", "Axios", self.db)
+        self.dialog.show()
+        QTest.qWait(0)  # Let the deferred load fill the table
+
+    def tearDown(self):
+        """Close the dialog and clean up temp database."""
+        self.dialog.deleteLater()
+        import src.votetracker.database as db_module
+        db_module.get_db_path = self.original_get_db_path
+        self.db.close()
+        os.unlink(self.temp_db.name)
+
+    def _open_target_editor(self, row: int):
+        """Start editing the target cell of a row; returns the combo editor."""
+        table = self.dialog._table
+        index = table.model().index(row, dialogs._ProviderMappingModel.TARGET_COLUMN)
+        table.setCurrentIndex(index)  # Opens the editor (AllEditTriggers)
+        editor = table.indexWidget(index)
+        self.assertIsNotNone(editor)
+        editor.lineEdit().clear()
+        return editor
+
+    def test_typing_pause_does_not_prompt(self):
+        """A half-typed target is never saved or offered as a new subject."""
+        with mock.patch.object(dialogs.QMessageBox, "question") as question:
+            editor = self._open_target_editor(0)
+            QTest.keyClicks(editor.lineEdit(), "Chem")
+            QTest.qWait(MAPPING_SAVE_DELAY * 2)
+
+            question.assert_not_called()
+            self.assertEqual(self.db.get_subjects(), self.subjects)
+            self.assertEqual(
+                self.db.get_provider_subject_mapping("axios", "MATEMATICA"), "Math"
+            )
+            # Still editing: the cell was not reloaded under the user
+            self.assertEqual(editor.currentText(), "Chem")
+
+    def test_open_editor_is_saved_on_close(self):
+        """Text still in the editor when the dialog closes is saved."""
+        self.db.add_subject("Physics")
+        self.dialog._vt_subjects_set.add("Physics")
+        with mock.patch.object(dialogs.QMessageBox, "question") as question:
+            editor = self._open_target_editor(0)
+            QTest.keyClicks(editor.lineEdit(), "Physics")
+            self.dialog.accept()
+
+            question.assert_not_called()
+        self.assertEqual(
+            self.db.get_provider_subject_mapping("axios", "MATEMATICA"), "Physics"
+        )
+        self.assertTrue(self.dialog.was_changed())
+
+    def _edit_two_rows_to_new_subjects(self):
+        """Point two rows at subjects that don't exist and let the saves run."""
+        self.db.save_provider_subject_mapping("axios", "FISICA", "Math")
+        self.dialog._load_mappings()
+        model = self.dialog._model
+        for source, target in (("MATEMATICA", "Algebra"), ("FISICA", "Physics")):
+            row = model.row_of(source)
+            model.setData(model.index(row, model.TARGET_COLUMN), target)
+        QTest.qWait(MAPPING_SAVE_DELAY * 2)
+
+    def test_new_subjects_confirmed_once_on_close(self):
+        """Several new subjects are offered in one question when the dialog closes."""
+        with mock.patch.object(
+            dialogs.QMessageBox, "question", return_value=dialogs.QMessageBox.StandardButton.Yes
+        ) as question:
+            self._edit_two_rows_to_new_subjects()
+            question.assert_not_called()
+            self.assertEqual(
+                self.db.get_provider_subject_mapping("axios", "MATEMATICA"), "Math"
+            )
+
+            self.dialog.accept()
+
+            self.assertEqual(question.call_count, 1)
+        self.assertIn("Algebra", self.db.get_subjects())
+        self.assertIn("Physics", self.db.get_subjects())
+        self.assertEqual(
+            self.db.get_provider_subject_mapping("axios", "MATEMATICA"), "Algebra"
+        )
+        self.assertEqual(self.db.get_provider_subject_mapping("axios", "FISICA"), "Physics")
+
+    def test_new_subjects_declined_on_close(self):
+        """Declining the question keeps the saved mappings and creates nothing."""
+        with mock.patch.object(
+            dialogs.QMessageBox, "question", return_value=dialogs.QMessageBox.StandardButton.No
+        ) as question:
+            self._edit_two_rows_to_new_subjects()
+            self.dialog.accept()
+
+            self.assertEqual(question.call_count, 1)
+        self.assertEqual(self.db.get_subjects(), self.subjects)
+        self.assertEqual(
+            self.db.get_provider_subject_mapping("axios", "MATEMATICA"), "Math"
+        )
+        self.assertEqual(self.db.get_provider_subject_mapping("axios", "FISICA"), "Math")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+"""
+Unit tests for subject matching.
+"""
+from __future__ import annotations
+
+import unittest
+from src.votetracker.subject_matcher import (
+    find_best_match, get_auto_suggestions, get_auto_suggestions_batch
+)
+
+class TestSubjectMatcher(unittest.TestCase):
+    """Test suite for subject auto-suggestions."""
+
+    VT_SUBJECTS = ["Math", "Italiano", "Storia dell'arte", "Physical Education"]
+
+    def test_exact_match(self):
+        """Test case-insensitive exact match."""
+        self.assertEqual(find_best_match("  ITALIANO ", self.VT_SUBJECTS), ("Italiano", 1.0))
+
+    def test_keyword_match(self):
+        """Test matching through the keyword table."""
+        suggestion = get_auto_suggestions("MATEMATICA E COMPLEMENTI", self.VT_SUBJECTS)
+        self.assertEqual(suggestion["suggested_match"], "Math")
+        self.assertEqual(suggestion["action"], "map")
+
+    def test_no_match_suggests_canonical(self):
+        """Test that unmatched subjects suggest a canonical name."""
+        suggestion = get_auto_suggestions("LINGUA E CULTURA INGLESE", self.VT_SUBJECTS)
+        self.assertIsNone(suggestion["suggested_match"])
+        self.assertEqual(suggestion["suggested_new"], "English")
+        self.assertEqual(suggestion["action"], "create")
+
+    def test_batch_matches_single(self):
+        """Test that batch suggestions equal per-subject suggestions."""
+        sources = ["MATEMATICA", "ITALIANO", "STORIA", "SCIENZE MOTORIE", "???", ""]
+        batch = get_auto_suggestions_batch(sources, self.VT_SUBJECTS)
+        self.assertEqual(
+            batch, [get_auto_suggestions(s, self.VT_SUBJECTS) for s in sources]
+        )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,7 +4,9 @@ Unit tests for utility functions.
 from __future__ import annotations
 
 import unittest
-from src.votetracker.utils import calc_average, round_report_card, get_status_color
+from src.votetracker.utils import (
+    calc_average, calc_type_averages, round_report_card, get_status_color
+)
 from src.votetracker.constants import PASSING_GRADE, GRADE_INSUFFICIENT
 
 class TestUtils(unittest.TestCase):
@@ -52,6 +54,25 @@ class TestUtils(unittest.TestCase):
         ]
         self.assertEqual(calc_average(votes), 0.0)
 
+    def test_calc_type_averages(self):
+        """Test single-pass overall/written/oral averages."""
+        votes = [
+            {'grade': 6.0, 'weight': 1.0, 'type': 'Written'},
+            {'grade': 7.5, 'weight': 1.5, 'type': 'Oral'},
+            {'grade': 9.0, 'weight': 2.0, 'type': 'Written'},
+            {'grade': 0.0, 'weight': 1.0, 'type': 'Oral'},
+            {'grade': 5.0, 'weight': 1.0, 'type': 'Practical'},
+        ]
+        overall, written, oral = calc_type_averages(votes)
+        self.assertEqual(overall, calc_average(votes))
+        self.assertEqual(written, calc_average([v for v in votes if v['type'] == 'Written']))
+        self.assertEqual(oral, 7.5)
+
+    def test_calc_type_averages_empty(self):
+        """Test single-pass averages with no gradable votes."""
+        self.assertEqual(calc_type_averages([]), (0.0, 0.0, 0.0))
+        self.assertEqual(calc_type_averages([{'grade': 0.0, 'type': 'Oral'}]), (0.0, 0.0, 0.0))
+
     # ========================================================================
     # ROUNDING TESTS
     # ========================================================================